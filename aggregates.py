@@ -0,0 +1,64 @@
+import pandas as pd
+
+
+# Running count and sum per Sample (or per combination of other key
+# columns) for every aggregated column. update() folds in a batch of samples
+# in time proportional to the batch, so per-river means never need a full
+# groupby over the history. stations optionally holds the same sums per
+# sampling station (see spatial.station_aggregates); every batch that has
+# its key columns is folded into it too
+class RiverAggregates:
+    def __init__(self, columns, keys=('Sample',)):
+        self.columns = list(columns)
+        self.keys = list(keys)
+        if len(self.keys) > 1:
+            index = pd.MultiIndex.from_arrays([[]] * len(self.keys), names=self.keys)
+        else:
+            index = pd.Index([], name=self.keys[0])
+        empty = pd.DataFrame(columns=self.columns, index=index, dtype=float)
+        self.count = empty
+        self.total = empty
+        self.stations = None
+        self._frame = None
+
+    @classmethod
+    def from_frame(cls, df, columns):
+        return cls(columns).update(df)
+
+    # Restore saved running sums (DataFrames indexed by the key columns)
+    @classmethod
+    def from_state(cls, count, total):
+        aggregates = cls(count.columns, count.index.names)
+        aggregates.count = count
+        aggregates.total = total
+        return aggregates
+
+    # Independent store with the same sums; update() replaces the sum frames
+    # rather than modifying them, so they can be shared
+    def copy(self):
+        aggregates = RiverAggregates.from_state(self.count, self.total)
+        if self.stations is not None:
+            aggregates.stations = self.stations.copy()
+        return aggregates
+
+    # Aggregated columns missing from batch count as missing values
+    def update(self, batch):
+        values = batch.reindex(columns=self.columns).astype(float)
+        keys = [batch[key] for key in self.keys] if len(self.keys) > 1 else batch[self.keys[0]]
+
+        grouped = values.groupby(keys)
+        self.count = self.count.add(grouped.count(), fill_value=0)
+        self.total = self.total.add(grouped.sum(), fill_value=0)
+        if self.stations is not None and set(self.stations.keys).issubset(batch.columns):
+            self.stations.update(batch)
+        self._frame = None
+        return self
+
+    def mean(self):
+        return (self.total / self.count).sort_index()
+
+    # Per-river means in the df_rivers layout (Sample column first)
+    def frame(self):
+        if self._frame is None:
+            self._frame = self.mean().reset_index()
+        return self._frame
@@ -0,0 +1,171 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from aggregates import RiverAggregates
+from pipeline import (build_rules, flag_matrix, score_flags, apply_rules, severity_bins, classify_severity,
+                      thresholds, demo_data, measurement_cols, agg_cols)
+
+app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+default_sizes = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+
+# Synthetic samples with the schema of the demo data: each row is a demo
+# sample with every measurement scaled by lognormal noise, spread over the
+# demo rivers (plus numbered ones when more rivers are asked for)
+def synthetic_samples(rows, rivers=12, seed=0):
+    rng = np.random.default_rng(seed)
+    base = pd.DataFrame(demo_data)
+    names = list(base['Sample']) + [f"River {i}" for i in range(len(base) + 1, rivers + 1)]
+
+    picks = rng.integers(0, len(base), rows)
+    df = pd.DataFrame({'Sample': np.array(names[:rivers])[rng.integers(0, rivers, rows)]})
+    for col in measurement_cols:
+        values = base[col].to_numpy(float)[picks]
+        df[col] = values * rng.lognormal(0, 0.3, rows)
+    return df
+
+
+# Best and median wall time of repeat calls of fn
+def measure(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {'best': min(times), 'median': statistics.median(times)}
+
+
+# Time each pipeline stage on a synthetic dataset of the given size:
+# threshold flags, risk score, the per-river aggregation and the severity
+# binning of slide 12 (applied to every sample score so it scales with rows)
+def bench_pipeline(rows, repeat):
+    df = synthetic_samples(rows)
+    rules = build_rules(thresholds)
+    flags = flag_matrix(df, rules)
+    apply_rules(df, rules)
+    scores = df['pollution_risk_score'].to_numpy()
+
+    stages = {
+        'flags': lambda: flag_matrix(df, rules),
+        'risk_score': lambda: score_flags(flags, rules),
+        'aggregate': lambda: RiverAggregates.from_frame(df, agg_cols).frame(),
+        'severity': lambda: classify_severity(df['pollution_risk_score'], severity_bins(scores)),
+    }
+    results = []
+    for stage, fn in stages.items():
+        results.append({'rows': rows, 'stage': stage, **measure(fn, repeat)})
+        print(f"{rows:>10,} rows  {stage:<12} {results[-1]['best'] * 1000:10.2f} ms", file=sys.stderr)
+    return results
+
+
+# Time every slide function in the headless Streamlit test runner. The first
+# run includes loading the data and building figures; later runs are served
+# from the caches, as for a returning viewer
+def bench_slides(repeat, data_path=None):
+    import config
+    from streamlit.testing.v1 import AppTest
+    from slides import slide_titles
+
+    config.DATA_PATH = data_path
+    results = []
+    for title in slide_titles:
+        times = []
+        for _ in range(repeat + 1):
+            at = AppTest.from_file(app_path, default_timeout=600)
+            at.session_state['slide_index'] = slide_titles.index(title)
+            start = time.perf_counter()
+            at.run()
+            times.append(time.perf_counter() - start)
+            if at.exception:
+                raise RuntimeError(f"Slide '{title}' failed: {at.exception[0].message}")
+
+        results.append({'slide': title, 'first': times[0],
+                        'best': min(times[1:]), 'median': statistics.median(times[1:])})
+        print(f"{title:<45} first {times[0] * 1000:9.1f} ms  cached {results[-1]['best'] * 1000:9.1f} ms",
+              file=sys.stderr)
+    return results
+
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(app_path),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Print the relative change of every timing shared by two result files
+def compare(baseline, current):
+    def keyed(results):
+        timings = {(row['rows'], row['stage']): row['best'] for row in results['pipeline']}
+        timings.update({('slide', row['slide']): row['best'] for row in results['slides']})
+        return timings
+
+    before = keyed(baseline)
+    for key, seconds in keyed(current).items():
+        if key in before and before[key] > 0:
+            print(f"{str(key[0]):>10}  {key[1]:<45} {before[key] * 1000:10.2f} -> {seconds * 1000:10.2f} ms "
+                  f"({seconds / before[key] - 1:+.0%})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the data pipeline stages and every slide, as JSON.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=default_sizes,
+                        help="synthetic dataset sizes in rows (default: 10^3 to 10^7)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per measurement (default: 3)")
+    parser.add_argument('--slide-rows', type=int, default=0,
+                        help="run the slides on a synthetic lab file of this many rows (default: demo data)")
+    parser.add_argument('--skip-slides', action='store_true', help="only time the pipeline stages")
+    parser.add_argument('--out', default='benchmark.json', help="results file (default: benchmark.json)")
+    parser.add_argument('--compare', help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    results = {
+        'commit': _commit(),
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.platform(),
+        'cpus': os.cpu_count(),
+        'repeat': args.repeat,
+        'pipeline': [],
+        'slides': [],
+    }
+    for rows in args.sizes:
+        results['pipeline'] += bench_pipeline(rows, args.repeat)
+
+    if not args.skip_slides:
+        if args.slide_rows:
+            with tempfile.TemporaryDirectory() as tmp:
+                data_path = os.path.join(tmp, 'samples.parquet')
+                synthetic_samples(args.slide_rows).to_parquet(data_path, index=False)
+                results['slide_rows'] = args.slide_rows
+                results['slides'] = bench_slides(args.repeat, data_path)
+        else:
+            results['slides'] = bench_slides(args.repeat)
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote results to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(json.load(f), results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+import argparse
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from pipeline import agg_cols
+
+# Upper bound on resampling weights held at once (replicates x samples)
+block_cells = 4_000_000
+
+
+# Bootstrap means of every column of values (samples x columns) for one
+# river. Each replicate is stored as how many times it draws each sample, so
+# a block of replicates is one counts matrix and its means one matrix
+# multiply. Blocks keep memory bounded for rivers with many samples
+def river_replicates(values, replicates, seed):
+    rng = np.random.default_rng(seed)
+    n = len(values)
+    block = max(1, min(replicates, block_cells // n))
+
+    means = np.empty((replicates, values.shape[1]))
+    for start in range(0, replicates, block):
+        size = min(block, replicates - start)
+        draws = rng.integers(0, n, size=(size, n), dtype=np.int32) + np.arange(size)[:, None] * n
+        counts = np.bincount(draws.ravel(), minlength=size * n).reshape(size, n).astype(float)
+        means[start:start + size] = counts @ values / n
+    return means
+
+
+# Percentile interval of one river's bootstrap means; None for rivers with a
+# single sample, which have no sampling variability to resample
+def river_interval(values, replicates, confidence, seed):
+    if len(values) < 2:
+        return None
+    means = river_replicates(values, replicates, seed)
+    tail = (1 - confidence) / 2 * 100
+    return np.percentile(means, [tail, 100 - tail], axis=0)
+
+
+def _worker_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+# Bootstrap confidence intervals of the per-river means of columns (every
+# measurement, exceedance rate and the risk score by default) from row-level
+# samples. Rivers are resampled in parallel across worker processes; each
+# gets its own seed stream, so results do not depend on the worker count.
+# Returns one row per river and column with the point mean, the interval and
+# the number of samples (lower/upper are NaN for single-sample rivers)
+def bootstrap_intervals(df, columns=agg_cols, replicates=2000, confidence=0.95, seed=0, workers=None):
+    columns = list(columns)
+    groups = [(river, rows[columns].to_numpy(float))
+              for river, rows in df.groupby('Sample', sort=True)]
+    seeds = np.random.SeedSequence(seed).spawn(len(groups))
+
+    jobs = [(values, replicates, confidence, river_seed) for (_, values), river_seed in zip(groups, seeds)]
+    resampled = sum(len(values) > 1 for _, values in groups)
+    if workers == 1 or resampled < 2:
+        intervals = [river_interval(*job) for job in jobs]
+    else:
+        # Workers come from a forkserver rather than forking the (threaded)
+        # Streamlit server, whose held locks a forked child would inherit
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_worker_context()) as pool:
+            intervals = list(pool.map(river_interval, *zip(*jobs)))
+
+    parts = []
+    for (river, values), interval in zip(groups, intervals):
+        if interval is None:
+            interval = np.full((2, len(columns)), np.nan)
+        parts.append(pd.DataFrame({
+            'Sample': river,
+            'parameter': columns,
+            'mean': values.mean(axis=0),
+            'lower': interval[0],
+            'upper': interval[1],
+            'samples': len(values),
+        }))
+    return pd.concat(parts, ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bootstrap confidence intervals for per-river means.")
+    parser.add_argument('--replicates', type=int, default=2000, help="bootstrap replicates per river (default: 2000)")
+    parser.add_argument('--confidence', type=float, default=0.95, help="interval confidence level (default: 0.95)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--out', help="write the intervals to this CSV file instead of printing them")
+    args = parser.parse_args(argv)
+
+    from pipeline import read_columns
+
+    df = read_columns(['Sample'] + agg_cols)
+    intervals = bootstrap_intervals(df, agg_cols, args.replicates, args.confidence, args.seed, args.workers)
+
+    if args.out:
+        intervals.to_csv(args.out, index=False)
+        print(f"Wrote intervals for {intervals['Sample'].nunique()} rivers to {args.out}")
+    else:
+        print(intervals.round(4).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
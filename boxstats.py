@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+
+# Tukey box statistics of column per river: quartiles, whiskers at the most
+# extreme samples within 1.5 IQR of the box, and the samples beyond them.
+# Every statistic is one grouped pass over the samples, so the result has
+# one row per river however many samples there are. At most max_outliers
+# outliers are returned, split evenly between rivers and keeping the ones
+# farthest from their river's median; with more rivers than that, the
+# farthest overall are kept. Returns (stats, outliers)
+def box_summary(df, column, max_outliers=500):
+    rows = df[['Sample', column]].dropna()
+    if rows.empty:
+        return (pd.DataFrame(columns=['Sample', 'count', 'lowerfence', 'q1', 'median', 'q3', 'upperfence']),
+                rows.reset_index(drop=True))
+    codes, rivers = pd.factorize(rows['Sample'].astype(str), sort=True)
+    values = rows[column].to_numpy(float)
+    grouped = pd.Series(values).groupby(codes)
+
+    stats = grouped.quantile([0.25, 0.5, 0.75]).unstack().to_numpy()
+    q1, median, q3 = stats[:, 0], stats[:, 1], stats[:, 2]
+    iqr = q3 - q1
+    inside = (values >= (q1 - 1.5 * iqr)[codes]) & (values <= (q3 + 1.5 * iqr)[codes])
+    whiskers = pd.Series(values[inside]).groupby(codes[inside]).agg(['min', 'max']).reindex(range(len(rivers)))
+
+    stats = pd.DataFrame({
+        'Sample': rivers,
+        'count': grouped.size().to_numpy(),
+        'lowerfence': whiskers['min'].to_numpy(),
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'upperfence': whiskers['max'].to_numpy(),
+    })
+
+    outside = np.flatnonzero(~inside)
+    if max_outliers:
+        distance = np.abs(values[outside] - median[codes[outside]])
+        if len(rivers) > max_outliers:
+            outside = np.sort(outside[np.argsort(-distance, kind='stable')[:max_outliers]])
+        else:
+            outside = outside[np.lexsort((-distance, codes[outside]))]
+            rank = np.arange(len(outside)) - np.searchsorted(codes[outside], codes[outside])
+            outside = outside[rank < max_outliers // len(rivers)]
+    else:
+        outside = outside[:0]
+    outliers = pd.DataFrame({'Sample': rivers[codes[outside]], column: values[outside]})
+    return stats, outliers
@@ -0,0 +1,220 @@
+import argparse
+import io
+import json
+import os
+import sys
+
+import config
+
+# File layout: magic, header length (8 bytes, little endian), JSON header,
+# then the sections. Section offsets in the header are relative to the end
+# of the header rounded up to 64 bytes, and each section starts 64-byte
+# aligned
+magic = b'BLUEMETRIC-BUNDLE1\n'
+alignment = 64
+
+# Slide results read from the loaded bundle, keyed like the slide caches
+# they seed and always including the dataset fingerprint
+saved_results = {}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:
+        raise ImportError("Dataset bundles require pyarrow (pip install pyarrow)")
+    return pyarrow
+
+
+def _ipc(table):
+    import pyarrow.ipc as ipc
+
+    sink = io.BytesIO()
+    with ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+# Aggregate running sums as one table: the key columns (Sample for rivers),
+# then count/<col> and total/<col> for every aggregated column
+def _aggregate_table(aggregates):
+    pa = _require_pyarrow()
+    import pandas as pd
+
+    parts = {name: getattr(aggregates, name).sort_index().add_prefix(f"{name}/")
+             for name in ('count', 'total')}
+    state = pd.concat(parts.values(), axis=1).reset_index()
+    return pa.Table.from_pandas(state, preserve_index=False)
+
+
+def _aggregates(state):
+    from aggregates import RiverAggregates
+
+    state = state.set_index([col for col in state.columns if '/' not in col])
+    parts = [state[[col for col in state.columns if col.startswith(prefix)]]
+             .rename(columns=lambda col: col[len(prefix):])
+             for prefix in ('count/', 'total/')]
+    return RiverAggregates.from_state(*parts)
+
+
+# Run the whole pipeline once for a lab file (or the demo data) and write the
+# result to one file: the samples with their flags and risk score, the
+# per-river and per-station running sums, the Plotly specs of every
+# registered figure, the rendered matplotlib slide figures and the slide 6
+# heatmap matrices and box statistics. The app memory-maps it at startup
+# (BLUEMETRIC_BUNDLE) instead of recomputing any of it
+def build_bundle(out, source=None, chunk_rows=100_000, sample_rows=50_000, compact=False):
+    pa = _require_pyarrow()
+    import plotly.graph_objects as go
+
+    from compact import is_compact, mask_col, pack_flags
+    from figures import figure_registry
+    from pipeline import current_dataset, exceed_cols
+    from render_cache import render_png
+    from slides import data, impacts
+
+    # Slide figures read through the pipeline; point it at this source only
+    config.DATA_PATH, config.STORE_PATH, config.DB_PATH, config.BUNDLE_PATH = source, None, None, None
+    config.WATCH_PATH = None
+    config.CHUNK_ROWS, config.SAMPLE_ROWS, config.COMPACT = chunk_rows, sample_rows, compact
+    df, aggregates, fingerprint = current_dataset()
+
+    # Arrow stores booleans as bits, which pandas can only copy, so the
+    # exceedance flags are written packed into one mask column (see
+    # compact.py) that the app reads in place
+    samples = df
+    if not is_compact(df):
+        samples = df.drop(columns=exceed_cols).assign(**{mask_col: pack_flags(df[exceed_cols].to_numpy())})
+
+    sections = {
+        'samples': _ipc(pa.Table.from_pandas(samples, preserve_index=False)),
+        'rivers': _ipc(_aggregate_table(aggregates)),
+    }
+    if aggregates.stations is not None:
+        sections['stations'] = _ipc(_aggregate_table(aggregates.stations))
+
+    specs = {name: figure_registry.spec(name) for name in figure_registry.names()
+             if isinstance(figure_registry.get(name), go.Figure)}
+    sections['figures'] = json.dumps(specs).encode()
+
+    images = []
+    for key, draw in impacts.static_figures(fingerprint):
+        section = f"image/{len(images)}"
+        sections[section] = render_png(draw())
+        images.append([list(key), section])
+
+    results = []
+    for key, compute in data.bundled_results(fingerprint):
+        frames = compute()
+        names = []
+        for frame in frames if isinstance(frames, tuple) else (frames,):
+            names.append(f"result/{len(results)}/{len(names)}")
+            sections[names[-1]] = _ipc(pa.Table.from_pandas(frame))
+        results.append([list(key), names])
+
+    header = {
+        'fingerprint': fingerprint,
+        'source': os.path.abspath(source) if source else None,
+        'rows': int(aggregates.count['pollution_risk_score'].sum()),
+        'memory': df.attrs.get('memory'),
+        'images': images,
+        'results': results,
+        'sections': {},
+    }
+    offset = 0
+    for name, payload in sections.items():
+        header['sections'][name] = [offset, len(payload)]
+        offset = _align(offset + len(payload))
+    encoded = json.dumps(header).encode()
+    start = _align(len(magic) + 8 + len(encoded))
+
+    partial = f"{out}.{os.getpid()}.tmp"
+    with open(partial, 'wb') as f:
+        f.write(magic + len(encoded).to_bytes(8, 'little') + encoded)
+        for name, payload in sections.items():
+            f.seek(start + header['sections'][name][0])
+            f.write(payload)
+    os.replace(partial, out)
+    return header
+
+
+def _align(offset):
+    return -(-offset // alignment) * alignment
+
+
+def read_header(path):
+    with open(path, 'rb') as f:
+        if f.read(len(magic)) != magic:
+            raise ValueError(f"{path} is not a dataset bundle")
+        length = int.from_bytes(f.read(8), 'little')
+        header = json.loads(f.read(length))
+    header['start'] = _align(len(magic) + 8 + length)
+    return header
+
+
+# Map a bundle into memory and return (df, aggregates, fingerprint). The
+# numeric sample columns and the packed flag mask are views of the mapped
+# file rather than copies, so every process serving the same bundle shares
+# their pages. River and station labels are views too where pandas keeps
+# strings in Arrow (pandas 3); older pandas copies them into each process.
+# Saved figures seed the figure cache and the figure registry, and saved
+# slide results seed saved_results
+def load_bundle(path):
+    pa = _require_pyarrow()
+    import pyarrow.ipc as ipc
+
+    from figures import figure_registry
+    from render_cache import figure_cache
+
+    header = read_header(path)
+    buffer = pa.memory_map(path, 'r').read_buffer()
+
+    def section(name):
+        offset, length = header['sections'][name]
+        return buffer.slice(header['start'] + offset, length)
+
+    def table(name):
+        return ipc.open_file(pa.BufferReader(section(name))).read_all()
+
+    df = table('samples').to_pandas(split_blocks=True)
+    if header['memory']:
+        df.attrs['memory'] = header['memory']
+    aggregates = _aggregates(table('rivers').to_pandas())
+    if 'stations' in header['sections']:
+        aggregates.stations = _aggregates(table('stations').to_pandas())
+    aggregates.frame()
+
+    figure_registry.preload(json.loads(section('figures').to_pybytes()))
+    for key, name in header['images']:
+        figure_cache.put(tuple(key), section(name).to_pybytes())
+    saved_results.clear()
+    for key, names in header['results']:
+        frames = tuple(table(name).to_pandas() for name in names)
+        saved_results[tuple(key)] = frames if len(frames) > 1 else frames[0]
+    return df, aggregates, header['fingerprint']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute the dataset and slide figures into one bundle file.")
+    parser.add_argument('bundle', nargs='?', default=config.BUNDLE_PATH,
+                        help="bundle file to write (default: BLUEMETRIC_BUNDLE)")
+    parser.add_argument('--data', default=config.DATA_PATH,
+                        help="lab results file, CSV or Parquet (default: BLUEMETRIC_DATA, else the demo data)")
+    parser.add_argument('--chunk-rows', type=int, default=config.CHUNK_ROWS,
+                        help="rows read per chunk (default: BLUEMETRIC_CHUNK_ROWS)")
+    parser.add_argument('--sample-rows', type=int, default=config.SAMPLE_ROWS,
+                        help="row-level samples kept (default: BLUEMETRIC_SAMPLE_ROWS)")
+    parser.add_argument('--compact', action='store_true', default=config.COMPACT,
+                        help="store the samples in the compact layout (default: BLUEMETRIC_COMPACT)")
+    args = parser.parse_args(argv)
+
+    if not args.bundle:
+        parser.error("no bundle file given and BLUEMETRIC_BUNDLE is not set")
+    header = build_bundle(args.bundle, args.data, args.chunk_rows, args.sample_rows, args.compact)
+    print(f"Wrote {header['rows']} samples, {len(header['images'])} figures and {len(header['results'])} slide results to {args.bundle}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+import numpy as np
+
+
+# Leaf order of average-linkage (UPGMA) hierarchical clustering of the rows
+# of values by Euclidean distance, as in a clustered heatmap's dendrogram:
+# rows that merge early end up next to each other. The pairwise distances
+# are updated in place after every merge (Lance-Williams), so n rows take
+# n - 1 vectorized steps over an n x n matrix. Missing values count as 0
+def linkage_order(values):
+    values = np.nan_to_num(np.asarray(values, dtype=float))
+    n = len(values)
+    if n < 3:
+        return np.arange(n)
+
+    squared = (values ** 2).sum(axis=1)
+    distance = np.sqrt(np.maximum(squared[:, None] + squared[None, :] - 2 * values @ values.T, 0))
+    np.fill_diagonal(distance, np.inf)
+
+    sizes = np.ones(n)
+    leaves = [[i] for i in range(n)]
+    for _ in range(n - 1):
+        a, b = np.unravel_index(np.argmin(distance), distance.shape)
+        a, b = min(a, b), max(a, b)
+
+        # The merged cluster takes row a; row b is retired
+        merged = (sizes[a] * distance[a] + sizes[b] * distance[b]) / (sizes[a] + sizes[b])
+        distance[a] = merged
+        distance[:, a] = merged
+        distance[a, a] = np.inf
+        distance[b] = np.inf
+        distance[:, b] = np.inf
+        sizes[a] += sizes[b]
+        leaves[a] = leaves[a] + leaves[b]
+        leaves[b] = None
+    return np.array(leaves[0])
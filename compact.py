@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+from pipeline import measurement_cols, exceed_cols, station_col
+
+# All exceedance flags of a sample as bits of one integer, in exceed_cols order
+mask_col = 'exceed_mask'
+flag_bits = {flag: bit for bit, flag in enumerate(exceed_cols)}
+
+
+def pack_flags(flags):
+    flags = np.asarray(flags, dtype=np.uint16)
+    return flags @ (np.uint16(1) << np.arange(flags.shape[1], dtype=np.uint16))
+
+
+# Boolean columns for the given flags, decoded from the mask with one shift
+# and AND per flag
+def unpack_flags(mask, flags=exceed_cols):
+    mask = np.asarray(mask, dtype=np.uint16)
+    bits = np.array([flag_bits[flag] for flag in flags], dtype=np.uint16)
+    return (mask[:, None] >> bits) & 1 == 1
+
+
+def decode_flags(df, flags=exceed_cols):
+    return pd.DataFrame(unpack_flags(df[mask_col].to_numpy(), flags), columns=list(flags), index=df.index)
+
+
+# Compact copy of df: categorical Sample (and Station), float32 measurements
+# and risk score, a uint8 exceedance count, and every *_exceed column packed
+# into the uint16 exceed_mask column. The memory before and after is kept in
+# df.attrs['memory']
+def compact_frame(df):
+    before = df.memory_usage(deep=True).sum()
+
+    compact = df.drop(columns=exceed_cols)
+    compact['Sample'] = compact['Sample'].astype('category')
+    if station_col in compact:
+        compact[station_col] = compact[station_col].astype('category')
+    compact[measurement_cols] = compact[measurement_cols].astype(np.float32)
+    compact['exceedances_count'] = compact['exceedances_count'].astype(np.uint8)
+    compact['pollution_risk_score'] = compact['pollution_risk_score'].astype(np.float32)
+    compact[mask_col] = pack_flags(df[exceed_cols].to_numpy())
+
+    compact.attrs['memory'] = {'standard': int(before), 'compact': int(compact.memory_usage(deep=True).sum())}
+    return compact
+
+
+# Concatenate compact frames, merging the categories of categorical columns
+def concat(frames):
+    from pandas.api.types import union_categoricals
+
+    combined = pd.concat(frames, ignore_index=True)
+    for col in frames[0].select_dtypes('category'):
+        if all(col in frame for frame in frames):
+            combined[col] = union_categoricals([frame[col] for frame in frames])
+    return combined
+
+
+def is_compact(df):
+    return mask_col in df
+
+
+# Columns of df as callers see them: the mask stands for the flag columns
+def logical_columns(df):
+    columns = [col for col in df.columns if col != mask_col]
+    return columns + exceed_cols if is_compact(df) else columns
+
+
+# Select columns from a compact frame, decoding only the requested flags
+def select(df, columns):
+    flags = [col for col in columns if col in flag_bits]
+    if not flags:
+        return df[columns]
+    decoded = decode_flags(df, flags)
+    stored = [col for col in columns if col not in flag_bits]
+    return pd.concat([df[stored], decoded], axis=1)[columns]
+
+
+def memory_report(df):
+    memory = df.attrs.get('memory')
+    if not memory:
+        return None
+    saved = memory['standard'] - memory['compact']
+    return (f"Compact layout: {_size(memory['compact'])} instead of {_size(memory['standard'])} "
+            f"({saved / memory['standard']:.0%} smaller)")
+
+
+def _size(size):
+    return f"{size / 2 ** 20:.1f} MB" if size >= 2 ** 20 else f"{size / 2 ** 10:.1f} KB"
@@ -0,0 +1,48 @@
+import os
+
+# Lab results export (CSV or Parquet) to load instead of the built-in demo data
+DATA_PATH = os.environ.get('BLUEMETRIC_DATA')
+
+# Partitioned sample store (built with store.py) that slides read columns
+# from instead of loading the whole dataset
+STORE_PATH = os.environ.get('BLUEMETRIC_STORE')
+
+# SQLite sample database (built with db.py) with indexed samples and
+# materialized per-river aggregates; takes precedence over the store
+DB_PATH = os.environ.get('BLUEMETRIC_DB')
+
+# Precomputed dataset bundle (built with bundle.py) that is memory-mapped at
+# startup instead of loading DATA_PATH or the demo data
+BUNDLE_PATH = os.environ.get('BLUEMETRIC_BUNDLE')
+
+# Drop folder watched for new lab result files (CSV or Parquet), which are
+# appended to the loaded dataset while the app runs; checked every
+# WATCH_INTERVAL seconds. Not used with STORE_PATH or DB_PATH, which are
+# rebuilt with their own tools
+WATCH_PATH = os.environ.get('BLUEMETRIC_WATCH')
+WATCH_INTERVAL = float(os.environ.get('BLUEMETRIC_WATCH_INTERVAL', 5))
+
+# Rows read per chunk when streaming a lab results file
+CHUNK_ROWS = int(os.environ.get('BLUEMETRIC_CHUNK_ROWS', 100_000))
+
+# Row-level samples kept in memory (uniformly sampled) for tables and boxplots
+SAMPLE_ROWS = int(os.environ.get('BLUEMETRIC_SAMPLE_ROWS', 50_000))
+
+# Points sent to the browser per time-series chart, shared by its stations
+SERIES_POINTS = int(os.environ.get('BLUEMETRIC_SERIES_POINTS', 1000))
+
+# Risk scores separating Low/Medium and Medium/High severity as 'low,high',
+# or 'quantile' to split the rivers into thirds
+SEVERITY_BINS = os.environ.get('BLUEMETRIC_SEVERITY_BINS', '2,4')
+
+# Most outlier points drawn in a box chart, across all rivers
+BOX_OUTLIERS = int(os.environ.get('BLUEMETRIC_BOX_OUTLIERS', 500))
+
+# Keep the loaded samples in the compact layout (categorical keys, float32
+# measurements, exceedance flags packed into one bitmask column)
+COMPACT = os.environ.get('BLUEMETRIC_COMPACT', '').lower() in ('1', 'true', 'yes')
+
+# Per-slide timing, cache and memory instrumentation (off unless set to 1),
+# shown in a sidebar debug panel and written in Prometheus text format
+METRICS = os.environ.get('BLUEMETRIC_METRICS', '').lower() in ('1', 'true', 'yes')
+METRICS_PATH = os.environ.get('BLUEMETRIC_METRICS_FILE', 'metrics.prom') if METRICS else None
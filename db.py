@@ -0,0 +1,181 @@
+import argparse
+import os
+import sqlite3
+import sys
+
+import pandas as pd
+
+import config
+from ingest import iter_chunks
+from pipeline import (build_rules, apply_rules, prepare_samples, thresholds, time_col, station_col,
+                      exceed_cols, agg_cols)
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _columns_sql(columns):
+    return ', '.join(_quote(col) for col in columns)
+
+
+# Read-only connection; SQLite connections are cheap, so every query opens
+# its own and sessions never share one across threads
+def connect(path):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No sample database at {path} (build it with db.py)")
+    return sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+
+
+# Load a lab file (CSV or Parquet) into a file-backed SQLite database. Samples
+# are inserted chunk by chunk with their exceedance flags and risk score,
+# then indexed by river, date and risk score. Per-river (and per-station)
+# aggregates are materialized as tables so rankings never scan the samples
+def build_db(path, db_path, chunk_rows=100_000):
+    if os.path.exists(db_path) and not is_sample_db(db_path):
+        raise ValueError(f"{db_path} exists and is not a sample database")
+
+    # Built next to the target and moved over it once complete, so a failed
+    # build leaves any previous database in place
+    partial = f"{db_path}.{os.getpid()}.tmp"
+    if os.path.exists(partial):
+        os.remove(partial)
+
+    rules = build_rules(thresholds)
+    con = sqlite3.connect(partial)
+    built = False
+    try:
+        columns = None
+        for chunk in iter_chunks(path, chunk_rows):
+            prepare_samples(chunk)
+            apply_rules(chunk, rules)
+            chunk.to_sql('samples', con, if_exists='append', index=False)
+            columns = list(chunk.columns)
+        if columns is None:
+            raise ValueError(f"{os.path.basename(path)} contains no samples")
+
+        con.execute('CREATE INDEX samples_sample ON samples ("Sample")')
+        con.execute('CREATE INDEX samples_risk ON samples ("pollution_risk_score")')
+        if time_col in columns:
+            con.execute(f'CREATE INDEX samples_time ON samples ("Sample", {_quote(time_col)})')
+
+        means = ', '.join(f'AVG({_quote(col)}) AS {_quote(col)}' for col in agg_cols)
+        con.execute(f'CREATE TABLE rivers AS SELECT "Sample", COUNT(*) AS samples, {means} '
+                    'FROM samples GROUP BY "Sample" ORDER BY "Sample"')
+        con.execute('CREATE UNIQUE INDEX rivers_sample ON rivers ("Sample")')
+        con.execute('CREATE INDEX rivers_risk ON rivers ("pollution_risk_score")')
+
+        if station_col in columns:
+            con.execute(f'CREATE TABLE stations AS SELECT {_quote(station_col)}, MIN("Sample") AS "Sample", '
+                        'COUNT(*) AS samples, AVG("exceedances_count") AS "exceedances_count", '
+                        'AVG("pollution_risk_score") AS "pollution_risk_score" '
+                        f'FROM samples GROUP BY {_quote(station_col)}')
+            con.execute('CREATE INDEX stations_risk ON stations ("pollution_risk_score")')
+
+        con.execute('ANALYZE')
+        con.commit()
+        rows = con.execute('SELECT COUNT(*) FROM samples').fetchone()[0]
+        built = True
+    finally:
+        con.close()
+        if not built:
+            os.remove(partial)
+    os.replace(partial, db_path)
+    return rows
+
+
+# Whether path is an SQLite file with the samples table build_db creates
+def is_sample_db(path):
+    with open(path, 'rb') as f:
+        if f.read(16) != b'SQLite format 3\x00':
+            return False
+    con = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+    try:
+        return con.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'samples'").fetchone() is not None
+    except sqlite3.DatabaseError:
+        return False
+    finally:
+        con.close()
+
+
+def _read_sql(path, query, params=(), samples=False):
+    con = connect(path)
+    try:
+        df = pd.read_sql_query(query, con, params=params)
+    finally:
+        con.close()
+
+    # SQLite has no boolean or datetime types
+    for col in df.columns:
+        if samples and col in exceed_cols:
+            df[col] = df[col].astype(bool)
+        elif col == time_col:
+            df[col] = pd.to_datetime(df[col])
+    return df
+
+
+def table_columns(path, table='samples'):
+    con = connect(path)
+    try:
+        return [row[1] for row in con.execute(f'PRAGMA table_info({_quote(table)})')]
+    finally:
+        con.close()
+
+
+# Samples with only the given columns, optionally only for some rivers (via
+# the river index) and at most limit rows
+def read_samples(path, columns, rivers=None, limit=None):
+    query = f'SELECT {_columns_sql(columns)} FROM samples'
+    params = []
+    if rivers is not None:
+        query += f' WHERE "Sample" IN ({", ".join("?" * len(rivers))})'
+        params += list(rivers)
+    if limit is not None:
+        query += ' LIMIT ?'
+        params.append(int(limit))
+    return _read_sql(path, query, params, samples=True)
+
+
+# At most per_river samples of every river with the given columns. Rows are
+# picked in a fixed pseudo-random order of their rowid, so repeated reads
+# return the same sample
+def river_sample(path, columns, per_river):
+    query = (f'SELECT {_columns_sql(columns)} FROM (SELECT {_columns_sql(columns)}, ROW_NUMBER() OVER '
+             '(PARTITION BY "Sample" ORDER BY (rowid * 2654435761) % 4294967296) AS pick FROM samples) '
+             'WHERE pick <= ?')
+    return _read_sql(path, query, [int(per_river)], samples=True)
+
+
+# Materialized per-river means in the df_rivers layout
+def river_table(path, columns):
+    return _read_sql(path, f'SELECT "Sample", {_columns_sql(columns)} FROM rivers ORDER BY "Sample"')
+
+
+# Highest-scoring rows of a materialized table (rivers or stations), served
+# from the risk score index
+def top_n(path, columns, n=None, table='rivers', by='pollution_risk_score'):
+    query = f'SELECT {_columns_sql(columns)} FROM {_quote(table)} ORDER BY {_quote(by)} DESC'
+    params = []
+    if n is not None:
+        query += ' LIMIT ?'
+        params.append(int(n))
+    return _read_sql(path, query, params)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load a lab results file into the SQLite sample database.")
+    parser.add_argument('data', help="lab results file (CSV or Parquet)")
+    parser.add_argument('db', nargs='?', default=config.DB_PATH, help="database file (default: BLUEMETRIC_DB)")
+    parser.add_argument('--chunk-rows', type=int, default=config.CHUNK_ROWS,
+                        help="rows inserted per chunk (default: BLUEMETRIC_CHUNK_ROWS)")
+    args = parser.parse_args(argv)
+
+    if not args.db:
+        parser.error("no database file given and BLUEMETRIC_DB is not set")
+    rows = build_db(args.data, args.db, args.chunk_rows)
+    print(f"Wrote {rows} samples to {args.db}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
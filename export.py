@@ -0,0 +1,251 @@
+import argparse
+import base64
+import html
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from slides import slide_titles
+
+app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+formats = ('html', 'png', 'pdf')
+
+
+# Yield the elements of an AppTest tree in layout order (columns and tabs
+# are flattened left to right)
+def _walk(node):
+    for child in getattr(node, 'children', {}).values():
+        if getattr(child, 'children', None):
+            yield from _walk(child)
+        else:
+            yield child
+
+
+# Run one slide of the app without a browser using Streamlit's headless test
+# runner, and return its content in layout order as (kind, payload) blocks.
+# With rasterize, Plotly charts are also rendered to PNG with kaleido
+def render_slide(title, data_path=None, rasterize=False):
+    import config
+    from streamlit.testing.v1 import AppTest
+    from render_cache import figure_cache
+
+    config.DATA_PATH = data_path
+    images = []
+    listener = lambda key, png: images.append(png)
+
+    figure_cache.listeners.append(listener)
+    try:
+        at = AppTest.from_file(app_path, default_timeout=600)
+        at.session_state['slide_index'] = slide_titles.index(title)
+        at.run()
+    finally:
+        figure_cache.listeners.remove(listener)
+
+    if at.exception:
+        raise RuntimeError(f"Slide '{title}' failed: {at.exception[0].message}")
+
+    images = iter(images)
+    blocks = []
+    for element in _walk(at.main):
+        kind = getattr(element, 'type', None)
+        if kind in ('markdown', 'caption'):
+            blocks.append(('markdown', element.value))
+        elif kind in ('table', 'dataframe'):
+            blocks.append(('table', element.value.to_html(border=0)))
+        elif kind == 'metric':
+            blocks.append(('metric', (element.label, element.value)))
+        elif kind == 'image':
+            blocks.append(('image', next(images)))
+        elif kind == 'plotly_chart':
+            spec = element.proto.spec
+            blocks.append(('plotly', (spec, _plotly_png(spec) if rasterize else None)))
+    return title, blocks
+
+
+def _plotly_png(spec):
+    import plotly.io as pio
+    return pio.to_image(pio.from_json(spec), format='png', scale=2)
+
+
+# PNG and PDF output needs kaleido, which drives a local Chrome/Chromium
+# (install one with plotly_get_chrome). Fail before rendering any slide
+# rather than exporting decks without their charts
+def check_rasterizer():
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    try:
+        pio.to_image(go.Figure(), format='png')
+    except Exception as error:
+        reason = next((line.strip().rstrip(".") for line in str(error).splitlines() if line.strip()), type(error).__name__)
+        raise RuntimeError(f"Plotly charts cannot be rendered to PNG: {reason}. PNG and PDF export needs "
+                           "kaleido (pip install kaleido) and Chrome or Chromium (plotly_get_chrome)") from error
+
+
+def _slide_file(index, count):
+    return f"slide_{index:02d}_{count}.png"
+
+
+def write_pngs(out_dir, rendered):
+    for index, (title, blocks) in enumerate(rendered, start=1):
+        count = 0
+        for kind, payload in blocks:
+            png = payload if kind == 'image' else payload[1] if kind == 'plotly' else None
+            if png:
+                count += 1
+                with open(os.path.join(out_dir, _slide_file(index, count)), 'wb') as f:
+                    f.write(png)
+
+
+# Markdown as HTML. Raw HTML in the text is shown as text, as Streamlit does
+def _markdown_html(text):
+    import markdown
+    return markdown.markdown(text.replace('<', '&lt;'), extensions=['tables'])
+
+
+# Plotly JSON inside a <script> element; escaping '<' keeps a name such as
+# '</script>' in the data from ending the element
+def _script_json(spec):
+    return spec.replace('<', '\\u003c')
+
+
+def write_html(out_dir, rendered):
+    import plotly.offline
+
+    # One local copy of plotly.js so the deck works offline
+    with open(os.path.join(out_dir, 'plotly.min.js'), 'w', encoding='utf-8') as f:
+        f.write(plotly.offline.get_plotlyjs())
+
+    parts = []
+    chart_id = 0
+    for title, blocks in rendered:
+        parts.append(f'<section><h1>{html.escape(title)}</h1>')
+        for kind, payload in blocks:
+            if kind == 'markdown':
+                parts.append(f'<div class="md">{_markdown_html(payload)}</div>')
+            elif kind == 'table':
+                parts.append(payload)
+            elif kind == 'metric':
+                parts.append(f'<div class="metric"><b>{html.escape(payload[1])}</b> {html.escape(payload[0])}</div>')
+            elif kind == 'image':
+                parts.append(f'<img src="data:image/png;base64,{base64.b64encode(payload).decode()}">')
+            elif kind == 'plotly':
+                chart_id += 1
+                parts.append(f'<div id="chart-{chart_id}" class="chart"></div>'
+                             f'<script type="application/json" id="spec-{chart_id}">{_script_json(payload[0])}</script>'
+                             f'<script>(function(s){{Plotly.newPlot("chart-{chart_id}", s.data, s.layout)}})'
+                             f'(JSON.parse(document.getElementById("spec-{chart_id}").textContent));</script>')
+        parts.append('</section>')
+
+    page = ('<!DOCTYPE html><html><head><meta charset="utf-8"><title>Water Pollution in Ghana</title>'
+            '<script src="plotly.min.js"></script>'
+            '<style>body{font-family:sans-serif;max-width:1100px;margin:auto}section{page-break-after:always;'
+            'border-bottom:1px solid #ccc;padding:1em 0}img{max-width:100%}'
+            '.chart{height:500px}</style></head><body>' + '\n'.join(parts) + '</body></html>')
+    with open(os.path.join(out_dir, 'deck.html'), 'w', encoding='utf-8') as f:
+        f.write(page)
+
+
+# Plain text of a slide's markdown and metrics for its PDF page: markup is
+# dropped and long lines wrapped; text that does not fit the page is cut
+def _page_text(blocks, width=110, max_lines=48):
+    import re
+    import textwrap
+
+    lines = []
+    for kind, payload in blocks:
+        if kind == 'markdown':
+            text = re.sub(r'\*|__|`|^#+\s*|^>\s*|[\U00010000-\U0010FFFF]', '', payload, flags=re.MULTILINE)
+            for line in text.splitlines():
+                lines += textwrap.wrap(line, width, subsequent_indent='  ') or ['']
+        elif kind == 'metric':
+            lines.append(f"{payload[0]}: {payload[1]}")
+    if len(lines) > max_lines:
+        lines = lines[:max_lines - 1] + ['…']
+    return '\n'.join(lines)
+
+
+# One PDF page per slide with its text, then one page per chart, titled
+# with its slide
+def write_pdf(out_dir, rendered):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.image as mpimg
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    with PdfPages(os.path.join(out_dir, 'deck.pdf')) as pdf:
+        for title, blocks in rendered:
+            fig = plt.figure(figsize=(11, 8.5))
+            fig.suptitle(title)
+            fig.text(0.05, 0.9, _page_text(blocks), va='top', fontsize=9, family='sans-serif')
+            pdf.savefig(fig)
+            plt.close(fig)
+
+            for kind, payload in blocks:
+                png = payload if kind == 'image' else payload[1] if kind == 'plotly' else None
+                if not png:
+                    continue
+                fig = plt.figure(figsize=(11, 8.5))
+                fig.suptitle(title)
+                ax = fig.add_axes([0.05, 0.05, 0.9, 0.85])
+                ax.imshow(mpimg.imread(BytesIO(png), format='png'))
+                ax.axis('off')
+                pdf.savefig(fig)
+                plt.close(fig)
+
+
+def export(datasets, out_dir, selected_formats, workers=None):
+    rasterize = 'png' in selected_formats or 'pdf' in selected_formats
+    titles = slide_titles
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            data_path: [pool.submit(render_slide, title, data_path, rasterize) for title in titles]
+            for data_path in datasets
+        }
+
+        for data_path, slide_futures in futures.items():
+            target = out_dir
+            if len(datasets) > 1:
+                target = os.path.join(out_dir, os.path.splitext(os.path.basename(data_path))[0])
+            os.makedirs(target, exist_ok=True)
+
+            rendered = [future.result() for future in slide_futures]
+            if 'png' in selected_formats:
+                write_pngs(target, rendered)
+            if 'html' in selected_formats:
+                write_html(target, rendered)
+            if 'pdf' in selected_formats:
+                write_pdf(target, rendered)
+            print(f"Exported {len(rendered)} slides to {target}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every slide headlessly to static PNG/HTML/PDF files.")
+    parser.add_argument('--data', nargs='*', default=None,
+                        help="lab results files (CSV/Parquet) to export one deck each; defaults to BLUEMETRIC_DATA or the demo data")
+    parser.add_argument('--out', default='export', help="output directory (default: export)")
+    parser.add_argument('--format', nargs='+', choices=formats, default=list(formats), dest='formats',
+                        help="output formats (default: all)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    datasets = args.data or [os.environ.get('BLUEMETRIC_DATA')]
+    if 'png' in args.formats or 'pdf' in args.formats:
+        try:
+            check_rasterizer()
+        except RuntimeError as error:
+            print(f"error: {error}", file=sys.stderr)
+            return 1
+    export(datasets, args.out, args.formats, args.workers)
+    return 0
+
+
+if __name__ == '__main__':
+    # Run from the importable module: the test runner replaces __main__ with
+    # app.py inside workers, so jobs must reference export.render_slide
+    from export import main
+    sys.exit(main())
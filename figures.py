@@ -0,0 +1,74 @@
+import threading
+import time
+
+
+# Process-wide registry of Plotly figures and tables built from static data.
+# Each registered builder runs once per process and every session is served
+# the memoized result, which callers must treat as read-only. hits and misses
+# count lookups served from memory versus built
+class FigureRegistry:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.build_seconds = 0.0
+        self._builders = {}
+        self._built = {}
+        self._specs = {}
+        self._preloaded = set()
+        self._lock = threading.Lock()
+
+    def register(self, name):
+        def decorator(builder):
+            self._builders[name] = builder
+            return builder
+        return decorator
+
+    def names(self):
+        return list(self._builders)
+
+    def get(self, name):
+        with self._lock:
+            if name in self._built:
+                self.hits += 1
+                return self._built[name]
+            self.misses += 1
+
+        # Build outside the lock so independent figures can be built
+        # concurrently; a racing duplicate build just loses the setdefault.
+        # Preloaded figures are parsed from their saved spec instead.
+        # build_seconds adds up the time spent in builders
+        start = time.perf_counter()
+        try:
+            if name in self._preloaded:
+                import plotly.io as pio
+                value = pio.from_json(self._specs[name], skip_invalid=True)
+            else:
+                value = self._builders[name]()
+        finally:
+            with self._lock:
+                self.build_seconds += time.perf_counter() - start
+        with self._lock:
+            return self._built.setdefault(name, value)
+
+    # Plotly JSON of a registered figure, serialized once per process
+    def spec(self, name):
+        with self._lock:
+            if name in self._specs:
+                return self._specs[name]
+
+        import plotly.io as pio
+        spec = pio.to_json(self.get(name), validate=False)
+        with self._lock:
+            return self._specs.setdefault(name, spec)
+
+    # Use saved Plotly JSON specs (name -> spec) instead of running builders
+    def preload(self, specs):
+        with self._lock:
+            self._specs.update(specs)
+            self._preloaded.update(specs)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'built': len(self._built)}
+
+
+figure_registry = FigureRegistry()
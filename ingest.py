@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from aggregates import RiverAggregates
+from pipeline import build_rules, apply_rules, prepare_samples, measurement_cols, optional_cols, agg_cols
+from spatial import station_aggregates
+
+parquet_suffixes = ('.parquet', '.pq')
+
+
+# Yield the lab file in DataFrames of at most chunk_rows rows, reading only
+# the Sample, measurement and (when present) time and station columns
+def iter_chunks(path, chunk_rows):
+    columns = ['Sample'] + measurement_cols
+
+    if path.lower().endswith(parquet_suffixes):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet lab files requires pyarrow (pip install pyarrow)")
+        parquet_file = pq.ParquetFile(path)
+        available = parquet_file.schema_arrow.names
+        _check_columns(path, available, columns)
+        columns += [col for col in optional_cols if col in available]
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+    else:
+        available = pd.read_csv(path, nrows=0).columns
+        _check_columns(path, available, columns)
+        columns += [col for col in optional_cols if col in available]
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_rows)
+
+
+def _check_columns(path, available, required):
+    missing = [col for col in required if col not in set(available)]
+    if missing:
+        raise ValueError(f"{os.path.basename(path)} is missing columns: {', '.join(missing)}")
+
+
+# Stream a lab file chunk by chunk: flag exceedances, fold each chunk into
+# the per-river (and per-station) aggregate store, and keep a bounded
+# uniform sample of rows (bottom-k on random keys), so memory does not grow
+# with the file size
+def stream_file(path, thresholds, chunk_rows, sample_rows, seed=42):
+    rules = build_rules(thresholds)
+    aggregates = RiverAggregates(agg_cols)
+    rng = np.random.default_rng(seed)
+
+    kept = None
+    offset = 0
+
+    for chunk in iter_chunks(path, chunk_rows):
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        prepare_samples(chunk)
+        apply_rules(chunk, rules)
+        if kept is None:
+            aggregates.stations = station_aggregates(chunk.columns)
+        aggregates.update(chunk)
+
+        chunk['_key'] = rng.random(len(chunk))
+        if kept is None:
+            kept = chunk
+        else:
+            if len(kept) >= sample_rows:
+                # Only rows below the current largest key can enter the sample
+                chunk = chunk[chunk['_key'] < kept['_key'].iloc[-1]]
+            kept = pd.concat([kept, chunk])
+        kept = kept.sort_values('_key').head(sample_rows)
+
+    if kept is None:
+        raise ValueError(f"{os.path.basename(path)} contains no samples")
+
+    df = kept.sort_index().drop(columns='_key').reset_index(drop=True)
+    aggregates.frame()  # materialize df_rivers before caching
+    return df, aggregates
@@ -0,0 +1,194 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from slides import slide_titles
+
+app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+# Resident and peak resident memory (bytes) of a process, from /proc
+def process_memory(pid):
+    memory = {}
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith(('VmRSS:', 'VmHWM:')):
+                    name, value = line.split(':')
+                    memory['rss' if name == 'VmRSS' else 'peak_rss'] = int(value.split()[0]) * 1024
+    except OSError:
+        pass
+    return memory
+
+
+# One browser tab: opens a session over the app's websocket and clicks
+# through the slides like the sidebar radio does. Each click is timed from
+# the request to the server's script_finished message
+class Viewer:
+    def __init__(self, url):
+        self.url = url
+        self.radio_id = None
+        self.errors = 0
+
+    async def run(self, slides, think, latencies):
+        import websockets
+
+        async with websockets.connect(self.url, max_size=None, subprotocols=['streamlit']) as ws:
+            await self._rerun(ws, None)
+            for index in slides:
+                start = time.perf_counter()
+                await self._rerun(ws, index)
+                latencies[index].append(time.perf_counter() - start)
+                if think:
+                    await asyncio.sleep(think)
+
+    async def _rerun(self, ws, index):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        message = BackMsg()
+        message.rerun_script.query_string = ''
+        if index is not None:
+            widget = message.rerun_script.widget_states.widgets.add()
+            widget.id = self.radio_id
+            widget.string_value = slide_titles[index]  # radios send the option's label
+        await ws.send(message.SerializeToString())
+
+        while True:
+            reply = ForwardMsg()
+            reply.ParseFromString(await ws.recv())
+            kind = reply.WhichOneof('type')
+            if kind == 'delta' and reply.delta.WhichOneof('type') == 'new_element':
+                element = reply.delta.new_element
+                if element.WhichOneof('type') == 'radio' and self.radio_id is None:
+                    self.radio_id = element.radio.id
+                elif element.WhichOneof('type') == 'exception':
+                    self.errors += 1
+            elif kind == 'script_finished':
+                return
+
+
+async def _load(url, viewers, slides, think, stagger):
+    latencies = {index: [] for index in slides}
+    clients = [Viewer(url) for _ in range(viewers)]
+
+    async def start(i, client):
+        await asyncio.sleep(i * stagger)
+        await client.run(slides, think, latencies)
+
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*(start(i, client) for i, client in enumerate(clients)),
+                                    return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    failures = [repr(outcome) for outcome in outcomes if isinstance(outcome, Exception)]
+    return latencies, elapsed, failures, sum(client.errors for client in clients)
+
+
+def _percentiles(values):
+    if not values:
+        return {'count': 0}
+    values = np.asarray(values) * 1000
+    return {'count': len(values), 'p50_ms': float(np.percentile(values, 50)),
+            'p99_ms': float(np.percentile(values, 99)), 'max_ms': float(values.max())}
+
+
+def _wait_for_server(port, process, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("Streamlit server exited during startup")
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Streamlit server did not start within {timeout} s")
+
+
+# Simulate viewers opening the deck at once and clicking through every slide;
+# returns the latency percentiles overall and per slide and the server memory
+def load_test(viewers, think=0.0, stagger=0.0, url=None, pid=None):
+    server = None
+    if url is None:
+        port = _free_port()
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'streamlit', 'run', app_path, '--server.headless', 'true',
+             '--server.port', str(port), '--browser.gatherUsageStats', 'false'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        pid = server.pid
+        url = f"ws://127.0.0.1:{port}/_stcore/stream"
+
+    try:
+        if server is not None:
+            _wait_for_server(port, server)
+        before = process_memory(pid) if pid else {}
+        slides = list(range(len(slide_titles)))
+        latencies, elapsed, failures, errors = asyncio.run(_load(url, viewers, slides, think, stagger))
+        after = process_memory(pid) if pid else {}
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    return {
+        'viewers': viewers,
+        'clicks': sum(len(values) for values in latencies.values()),
+        'seconds': elapsed,
+        'failed_viewers': failures,
+        'slide_errors': errors,
+        'overall': _percentiles([value for values in latencies.values() for value in values]),
+        'slides': {slide_titles[index]: _percentiles(values) for index, values in latencies.items()},
+        'memory_before': before,
+        'memory_after': after,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent viewers clicking through the deck.")
+    parser.add_argument('--viewers', type=int, default=50, help="concurrent viewers (default: 50)")
+    parser.add_argument('--think', type=float, default=0.0, help="seconds between a viewer's clicks (default: 0)")
+    parser.add_argument('--stagger', type=float, default=0.0,
+                        help="seconds between viewers joining (default: 0, all at once)")
+    parser.add_argument('--url', help="websocket URL of a running app, e.g. ws://host:8501/_stcore/stream "
+                                      "(default: start a local server)")
+    parser.add_argument('--pid', type=int, help="process ID of that server, to report its memory")
+    parser.add_argument('--out', help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = load_test(args.viewers, args.think, args.stagger, args.url, args.pid)
+
+    overall = results['overall']
+    print(f"{results['viewers']} viewers, {results['clicks']} slide changes in {results['seconds']:.1f} s")
+    if overall['count']:
+        print(f"latency p50 {overall['p50_ms']:.0f} ms  p99 {overall['p99_ms']:.0f} ms  max {overall['max_ms']:.0f} ms")
+    for title, stats in results['slides'].items():
+        if stats['count']:
+            print(f"  {title:<45} p50 {stats['p50_ms']:8.0f} ms  p99 {stats['p99_ms']:8.0f} ms")
+    memory = results['memory_after']
+    if memory:
+        print(f"server memory {memory.get('rss', 0) / 2 ** 20:.0f} MB (peak {memory.get('peak_rss', 0) / 2 ** 20:.0f} MB)")
+    if results['failed_viewers'] or results['slide_errors']:
+        print(f"{len(results['failed_viewers'])} viewers failed, {results['slide_errors']} slide errors")
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 1 if results['failed_viewers'] or results['slide_errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
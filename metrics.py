@@ -0,0 +1,157 @@
+import functools
+import os
+import threading
+import time
+import tracemalloc
+
+import config
+
+
+# Process-wide timings of slide reruns and pipeline stages. Everything here
+# is only active when config.METRICS is set; timed() then returns functions
+# unchanged, so disabled instrumentation costs nothing. Cache hits are the
+# figure cache and figure registry counters during the slide, build time is
+# the time spent building and rendering figures, and peak memory is the
+# tracemalloc peak, so all three include other sessions running at the same
+# time
+class Metrics:
+    def __init__(self):
+        self.slides = {}
+        self.stages = {}
+        self._lock = threading.Lock()
+
+    def record_slide(self, title, seconds, peak_bytes, hits, misses, build_seconds):
+        with self._lock:
+            entry = self.slides.setdefault(title, {
+                'reruns': 0, 'seconds_total': 0.0, 'seconds_last': 0.0, 'seconds_max': 0.0,
+                'peak_bytes': 0, 'cache_hits': 0, 'cache_misses': 0, 'build_seconds_total': 0.0,
+                'build_seconds_last': 0.0,
+            })
+            entry['reruns'] += 1
+            entry['seconds_total'] += seconds
+            entry['seconds_last'] = seconds
+            entry['seconds_max'] = max(entry['seconds_max'], seconds)
+            entry['peak_bytes'] = max(entry['peak_bytes'], peak_bytes)
+            entry['cache_hits'] += hits
+            entry['cache_misses'] += misses
+            entry['build_seconds_total'] += build_seconds
+            entry['build_seconds_last'] = build_seconds
+
+    def record_stage(self, stage, seconds):
+        with self._lock:
+            entry = self.stages.setdefault(stage, {'calls': 0, 'seconds_total': 0.0, 'seconds_max': 0.0})
+            entry['calls'] += 1
+            entry['seconds_total'] += seconds
+            entry['seconds_max'] = max(entry['seconds_max'], seconds)
+
+    # Prometheus text exposition format
+    def text(self):
+        with self._lock:
+            slides = {title: dict(entry) for title, entry in self.slides.items()}
+            stages = {stage: dict(entry) for stage, entry in self.stages.items()}
+
+        lines = []
+
+        def series(name, kind, label, entries, field):
+            lines.append(f"# TYPE bluemetric_{name} {kind}")
+            for key, entry in entries.items():
+                lines.append(f'bluemetric_{name}{{{label}="{_escape(key)}"}} {entry[field]}')
+
+        series('slide_reruns_total', 'counter', 'slide', slides, 'reruns')
+        series('slide_seconds_total', 'counter', 'slide', slides, 'seconds_total')
+        series('slide_seconds_last', 'gauge', 'slide', slides, 'seconds_last')
+        series('slide_seconds_max', 'gauge', 'slide', slides, 'seconds_max')
+        series('slide_peak_bytes', 'gauge', 'slide', slides, 'peak_bytes')
+        series('slide_cache_hits_total', 'counter', 'slide', slides, 'cache_hits')
+        series('slide_cache_misses_total', 'counter', 'slide', slides, 'cache_misses')
+        series('slide_build_seconds_total', 'counter', 'slide', slides, 'build_seconds_total')
+        series('slide_build_seconds_last', 'gauge', 'slide', slides, 'build_seconds_last')
+        series('stage_calls_total', 'counter', 'stage', stages, 'calls')
+        series('stage_seconds_total', 'counter', 'stage', stages, 'seconds_total')
+        series('stage_seconds_max', 'gauge', 'stage', stages, 'seconds_max')
+        return '\n'.join(lines) + '\n'
+
+    # Replace the metrics file in one step so a scraper never reads half of it
+    def write(self, path):
+        partial = f"{path}.{os.getpid()}.tmp"
+        with open(partial, 'w', encoding='utf-8') as f:
+            f.write(self.text())
+        os.replace(partial, path)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+metrics = Metrics()
+
+if config.METRICS and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+
+# Decorator recording the wall time of every call under stage; a no-op
+# unless metrics are enabled
+def timed(stage):
+    def decorator(fn):
+        if not config.METRICS:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                metrics.record_stage(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def _cache_counts():
+    from figures import figure_registry
+    from render_cache import figure_cache
+    return (figure_cache.hits + figure_registry.hits, figure_cache.misses + figure_registry.misses,
+            figure_cache.render_seconds + figure_registry.build_seconds)
+
+
+# Run a slide function and record its wall time, cache hits, figure build
+# time and peak memory, then refresh the metrics file
+def run_slide(title, render):
+    hits, misses, build = _cache_counts()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        render()
+    finally:
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        after_hits, after_misses, after_build = _cache_counts()
+        metrics.record_slide(title, seconds, peak, after_hits - hits, after_misses - misses, after_build - build)
+        if config.METRICS_PATH:
+            metrics.write(config.METRICS_PATH)
+
+
+# Sidebar panel with the per-slide and per-stage numbers
+def debug_panel():
+    import pandas as pd
+    import streamlit as st
+
+    with st.sidebar.expander("Debug: performance"):
+        slides = pd.DataFrame.from_dict(metrics.slides, orient='index')
+        if not slides.empty:
+            slides['peak_mb'] = slides.pop('peak_bytes') / 2 ** 20
+            slides['mean_ms'] = slides['seconds_total'] / slides['reruns'] * 1000
+            slides['last_ms'] = slides['seconds_last'] * 1000
+            slides['build_ms'] = slides['build_seconds_last'] * 1000
+            st.dataframe(slides[['reruns', 'last_ms', 'build_ms', 'mean_ms', 'cache_hits', 'cache_misses',
+                                 'peak_mb']].round(1),
+                         use_container_width=True)
+
+        stages = pd.DataFrame.from_dict(metrics.stages, orient='index')
+        if not stages.empty:
+            stages['mean_ms'] = stages['seconds_total'] / stages['calls'] * 1000
+            stages['max_ms'] = stages['seconds_max'] * 1000
+            st.dataframe(stages[['calls', 'mean_ms', 'max_ms']].round(2), use_container_width=True)
+
+        if config.METRICS_PATH:
+            st.caption(f"Written to {config.METRICS_PATH}")
@@ -0,0 +1,413 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import config
+from aggregates import RiverAggregates
+from metrics import timed
+
+# Define thresholds (WHO or most conservative between WHO, EPA, Ghana)
+thresholds = {
+    'As (mg/L)': 0.01,
+    'Cd (mg/L)': 0.003,
+    'Cr (mg/L)': 0.05,
+    'Pb (mg/L)': 0.01,
+    'pH_min': 6.5,
+    'pH_max': 8.5,
+    'TDS (mg/L)': 1000,
+    'Conductivity (µS/cm)': 1000,
+    'Hardness (mg/L)': 500,
+    'Ca Hardness (mg/L)': 500,
+    'Mg Hardness (mg/L)': 500
+}
+
+# Weight of each exceedance in the pollution risk score (toxic metals count most)
+risk_weights = {
+    'As_exceed': 2.5,
+    'Cd_exceed': 2.0,
+    'Cr_exceed': 2.0,
+    'Pb_exceed': 2.5,
+    'pH_exceed': 1.5,
+    'TDS_exceed': 1.0,
+    'Conductivity_exceed': 1.0,
+    'Hardness_exceed': 1.0,
+    'Ca_Hardness_exceed': 1.0,
+    'Mg_Hardness_exceed': 1.0
+}
+
+# Define the river names
+rivers = [
+    "River Oda", "River Birim", "River Pra Twifo", "River Ankobra", 
+    "River Subri", "River Anuru", "River Offin", "River Ashrey",
+    "River Butre", "River Tano", "River Pra Daboase", "Galamsey Pit"
+]
+
+# Demo data with all parameters, used when no lab results file is configured
+demo_data = {
+    'Sample': [
+        'River Oda', 'River Birim', 'River Pra Twifo', 'River Ankobra', 'River Subri', 'River Anuru',
+        'River Offin', 'River Ashrey', 'River Butre', 'River Tano', 'River Pra Daboase', 'Galamsey Pit'
+    ],
+    'As (mg/L)': [0.364, 0.372, 0.305, 0.221, 0.0, 0.444, 0.216, 0.367, 0.341, 0.346, 0.288, 0.291],
+    'Cd (mg/L)': [0.0, 0.0, 0.0, 0.0, 0.013, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    'Cr (mg/L)': [0.103, 0.037, 0.115, 0.293, 1.607, 0.15, 0.411, 0.096, 0.147, 0.187, 0.186, 0.021],
+    'Pb (mg/L)': [0.073, 0.065, 0.133, 0.119, 0.208, 0.062, 0.148, 0.079, 0.066, 0.086, 0.057, 0.051],
+    'pH': [5.93, 5.96, 5.65, 5.7, 5.25, 5.64, 6.46, 6.12, 5.67, 5.69, 5.62, 3.21],
+    'TDS (mg/L)': [0.08, 0.05, 0.06, 0.06, 0.03, 0.16, 0.14, 0.07, 0.05, 0.05, 0.05, 0.29],
+    'Conductivity (µS/cm)': [0.16, 0.1, 0.12, 0.12, 0.06, 0.31, 0.29, 0.13, 0.1, 0.09, 0.1, 0.57],
+    'Hardness (mg/L)': [3, 2.4, 2.2, 1.6, 5.0, 3, 3, 2.2, 4.2, 1.4, 2.2, 18],
+    'Ca Hardness (mg/L)': [1.2, 1.0, 1.0, 0.7, 1.8, 1.0, 1.2, 0.8, 2.0, 0.6, 1.0, 7.5],
+    'Mg Hardness (mg/L)': [1.8, 1.4, 1.2, 0.9, 3.2, 2.0, 1.8, 1.4, 2.2, 0.8, 1.2, 10.5]
+}
+
+measurement_cols = ['As (mg/L)', 'Cd (mg/L)', 'Cr (mg/L)', 'Pb (mg/L)', 'pH', 'TDS (mg/L)',
+                    'Conductivity (µS/cm)', 'Hardness (mg/L)', 'Ca Hardness (mg/L)', 'Mg Hardness (mg/L)']
+
+exceed_cols = list(risk_weights)
+
+score_cols = ['exceedances_count', 'pollution_risk_score']
+
+# Columns averaged per river in df_rivers
+agg_cols = measurement_cols + exceed_cols + score_cols
+
+# Optional per-sample columns: when the sample was taken, at which station,
+# and the station's coordinates (decimal degrees, WGS84)
+time_col = 'Timestamp'
+station_col = 'Station'
+lat_col = 'Latitude'
+lon_col = 'Longitude'
+optional_cols = [time_col, station_col, lat_col, lon_col]
+
+# Severity classes of a river's mean risk score. The top class ends at the
+# highest score the weights allow, so every score gets a class
+severity_labels = ['Low', 'Medium', 'High']
+max_risk_score = sum(risk_weights.values())
+default_severity_edges = [2.0, 4.0]
+
+
+# Rules table: one row per exceedance flag with the parameter it checks,
+# the safe range (values outside [lower, upper] exceed) and its risk weight
+def build_rules(thresholds, weights=risk_weights):
+    rows = [
+        ('As_exceed', 'As (mg/L)', -np.inf, thresholds['As (mg/L)']),
+        ('Cd_exceed', 'Cd (mg/L)', -np.inf, thresholds['Cd (mg/L)']),
+        ('Cr_exceed', 'Cr (mg/L)', -np.inf, thresholds['Cr (mg/L)']),
+        ('Pb_exceed', 'Pb (mg/L)', -np.inf, thresholds['Pb (mg/L)']),
+        ('pH_exceed', 'pH', thresholds['pH_min'], thresholds['pH_max']),
+        ('TDS_exceed', 'TDS (mg/L)', -np.inf, thresholds['TDS (mg/L)']),
+        ('Conductivity_exceed', 'Conductivity (µS/cm)', -np.inf, thresholds['Conductivity (µS/cm)']),
+        ('Hardness_exceed', 'Hardness (mg/L)', -np.inf, thresholds['Hardness (mg/L)']),
+        ('Ca_Hardness_exceed', 'Ca Hardness (mg/L)', -np.inf, thresholds['Ca Hardness (mg/L)']),
+        ('Mg_Hardness_exceed', 'Mg Hardness (mg/L)', -np.inf, thresholds['Mg Hardness (mg/L)'])
+    ]
+    rules = pd.DataFrame(rows, columns=['flag', 'parameter', 'lower', 'upper'])
+    rules['weight'] = rules['flag'].map(weights).astype(float)
+    return rules
+
+
+# Parse the optional time and station columns into datetimes and string IDs
+def prepare_samples(df):
+    if time_col in df:
+        df[time_col] = pd.to_datetime(df[time_col])
+    if station_col in df:
+        df[station_col] = df[station_col].astype(str)
+    return df
+
+
+# Evaluate every rule in one broadcast over the measurement matrix: a
+# samples x rules boolean matrix of exceedances
+def flag_matrix(df, rules):
+    values = df[list(rules['parameter'])].to_numpy(dtype=float)
+
+    flags = values < rules['lower'].to_numpy()
+    flags |= values > rules['upper'].to_numpy()
+    return flags
+
+
+# Count and weighted score from a single product with [1, weight] per rule
+def score_flags(flags, rules):
+    return flags @ np.column_stack([np.ones(len(rules)), rules['weight'].to_numpy()])
+
+
+# Add the flag, exceedances_count and pollution_risk_score columns to df in place
+@timed('apply_rules')
+def apply_rules(df, rules):
+    flags = flag_matrix(df, rules)
+    totals = score_flags(flags, rules)
+
+    df[list(rules['flag'])] = flags
+    df['exceedances_count'] = totals[:, 0].astype(np.int64)
+    df['pollution_risk_score'] = totals[:, 1]
+    return df
+
+
+# Bin edges from 0 to max_risk_score for severity_labels. setting is
+# 'quantile' (thirds of the given scores) or the two inner edges as 'low,high';
+# quantiles that do not split the scores fall back to the default edges
+def severity_bins(scores, setting='2,4'):
+    if setting == 'quantile':
+        inner = list(np.nanquantile(scores, [1 / 3, 2 / 3])) if len(scores) else []
+        if not inner or not 0 < inner[0] < inner[1] < max_risk_score:
+            inner = default_severity_edges
+    else:
+        inner = [float(edge) for edge in setting.split(',')]
+        if len(inner) != 2 or not 0 < inner[0] < inner[1] < max_risk_score:
+            raise ValueError(f"Severity bins must be 'quantile' or two increasing scores between 0 and "
+                             f"{max_risk_score:g}, got {setting!r}")
+    return [0.0] + inner + [max_risk_score]
+
+
+def classify_severity(scores, bins):
+    return pd.cut(scores, bins=bins, labels=severity_labels, include_lowest=True)
+
+
+# Rows of frame with the n largest values of column, largest first (all
+# rows when n is None). Only the selected rows are sorted: argpartition
+# finds them in linear time
+def top_k(frame, column, n=None):
+    values = frame[column].to_numpy(float)
+    if n is None or n >= len(frame):
+        picked = np.argsort(-values, kind='stable')
+    else:
+        picked = np.argpartition(-values, n - 1)[:n] if n > 0 else np.array([], dtype=int)
+        picked = picked[np.argsort(-values[picked], kind='stable')]
+    return frame.iloc[picked]
+
+
+# Fingerprint of the source dataset and the scoring config; the cache key for
+# the shared dataset, so reruns only recompute when one of them changes. Lab files
+# are identified by path, size and modification time rather than by hashing
+# their (possibly multi-GB) contents
+def dataset_fingerprint(source, thresholds, weights=risk_weights):
+    if isinstance(source, str):
+        stat = os.stat(source)
+        source = [os.path.abspath(source), stat.st_size, stat.st_mtime_ns]
+    digest = hashlib.sha256()
+    for part in (thresholds, weights, source):
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+# Build df (samples with flags and risk score) and the per-river aggregate
+# store (aggregates.frame() is df_rivers) from a data dict or a lab file path.
+# Lab files are streamed in chunks of chunk_rows, keeping at most
+# sample_rows rows of df in memory; with compact, df uses the compact layout
+# (see compact.py). There is one shared dataset per fingerprint for every
+# session in the process, built once even when many sessions ask at the same
+# time. Sessions receive the same objects rather than copies, so callers must
+# treat df and aggregates as read-only and derive new frames instead of
+# assigning into them
+@st.cache_resource(show_spinner=False, max_entries=4)
+@timed('build_dataset')
+def _build_dataset(fingerprint, _source, _thresholds, chunk_rows, sample_rows, compact=False):
+    if isinstance(_source, str):
+        from ingest import stream_file
+        df, aggregates = stream_file(_source, _thresholds, chunk_rows, sample_rows)
+    else:
+        df = prepare_samples(pd.DataFrame(_source))
+        apply_rules(df, build_rules(_thresholds))
+
+        # Combine measurements by river (mean), and by station when sampled
+        from spatial import station_aggregates
+        aggregates = RiverAggregates(agg_cols)
+        aggregates.stations = station_aggregates(df.columns)
+        aggregates.update(df)
+        aggregates.frame()  # materialize df_rivers before caching
+
+    if compact:
+        from compact import compact_frame
+        df = compact_frame(df)
+    return df, aggregates
+
+
+# Bundles are mapped once per process and file version
+@st.cache_resource(show_spinner=False, max_entries=1)
+@timed('load_bundle')
+def _load_bundle(path, mtime_ns):
+    from bundle import load_bundle
+    return load_bundle(path)
+
+
+# The configured dataset (config.BUNDLE_PATH, config.DATA_PATH or the demo
+# data) as (df, aggregates, fingerprint); the fingerprint keys figure caches
+def source_dataset():
+    if config.BUNDLE_PATH:
+        return _load_bundle(config.BUNDLE_PATH, os.stat(config.BUNDLE_PATH).st_mtime_ns)
+    source = config.DATA_PATH or demo_data
+    fingerprint = dataset_fingerprint(source, thresholds)
+    df, aggregates = _build_dataset(fingerprint, source, thresholds, config.CHUNK_ROWS, config.SAMPLE_ROWS,
+                                    config.COMPACT)
+    return df, aggregates, fingerprint
+
+
+# The dataset slides read: the configured one, plus every sample dropped into
+# config.WATCH_PATH since the server started
+def current_dataset():
+    if config.WATCH_PATH:
+        from watcher import live_dataset
+        return live_dataset(config.WATCH_PATH).snapshot()
+    return source_dataset()
+
+
+# Key of the samples the slides are reading: the sample database or store
+# build when one is configured, otherwise the loaded dataset's fingerprint
+def dataset_key():
+    if config.DB_PATH:
+        stat = os.stat(config.DB_PATH)
+        return hashlib.sha256(f"{os.path.abspath(config.DB_PATH)}:{stat.st_mtime_ns}".encode()).hexdigest()
+    if config.STORE_PATH:
+        from store import store_key
+        return store_key(config.STORE_PATH)
+    return current_dataset()[2]
+
+
+# Whether the slides read lab results rather than the demo data: a lab file,
+# sample store or database, a bundle built from a lab file, or a watched
+# folder that has ingested at least one file
+def lab_data_loaded():
+    if config.DATA_PATH or config.STORE_PATH or config.DB_PATH:
+        return True
+    if config.WATCH_PATH:
+        from watcher import live_dataset
+        if live_dataset(config.WATCH_PATH).files:
+            return True
+    if config.BUNDLE_PATH:
+        from bundle import read_header
+        return read_header(config.BUNDLE_PATH)['source'] is not None
+    return False
+
+
+def dataset_columns():
+    if config.DB_PATH:
+        from db import table_columns
+        return table_columns(config.DB_PATH)
+    if config.STORE_PATH:
+        from store import read_manifest
+        return read_manifest(config.STORE_PATH)['columns']
+    from compact import logical_columns
+    return logical_columns(current_dataset()[0])
+
+
+# Column reads are shared read-only across sessions like the dataset
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _read_store(key, columns, rivers, limit):
+    from store import read_store
+    return read_store(config.STORE_PATH, columns, rivers, limit)
+
+
+# Row-level samples with only the given columns, optionally only for some
+# rivers and at most limit rows. The sample database and store only read
+# those columns and filter rivers through their index or partitions
+@timed('read_columns')
+def read_columns(columns, rivers=None, limit=None):
+    columns = list(dict.fromkeys(columns))
+    if config.DB_PATH:
+        from db import read_samples
+        return read_samples(config.DB_PATH, columns, rivers, limit)
+    if config.STORE_PATH:
+        rivers = tuple(rivers) if rivers is not None else None
+        return _read_store(dataset_key(), columns, rivers, limit)
+
+    df = current_dataset()[0]
+    if rivers is not None:
+        df = df[df['Sample'].isin(rivers)]
+    if limit is not None:
+        df = df.head(limit)
+    from compact import is_compact, select
+    if is_compact(df):
+        return select(df, columns)
+    return df[columns]
+
+
+# Every sample of one river with the given columns: through the river filter
+# of the sample store or database, or streamed from the lab file keeping
+# only that river's rows. Bundles, watched folders and the demo data only
+# have the loaded row sample; their rows have attrs['sampled'] set
+@timed('river_rows')
+def river_rows(columns, river):
+    columns = list(dict.fromkeys(columns))
+    if config.DATA_PATH and not (config.DB_PATH or config.STORE_PATH or config.BUNDLE_PATH or config.WATCH_PATH):
+        from ingest import iter_chunks
+        parts = [chunk.loc[chunk['Sample'] == river, columns]
+                 for chunk in iter_chunks(config.DATA_PATH, config.CHUNK_ROWS)]
+        return prepare_samples(pd.concat(parts, ignore_index=True))
+
+    rows = read_columns(columns, rivers=[river])
+    if not (config.DB_PATH or config.STORE_PATH):
+        rows.attrs = {**rows.attrs, 'sampled': True}
+    return rows
+
+
+# Per-river means of the given columns in the df_rivers layout
+@timed('river_means')
+def river_means(columns):
+    if config.DB_PATH:
+        from db import river_table
+        return river_table(config.DB_PATH, list(columns))
+    if config.STORE_PATH:
+        rows = read_columns(['Sample'] + list(columns))
+        return rows.groupby('Sample', sort=True)[list(columns)].mean().reset_index()
+    return current_dataset()[1].frame()[['Sample'] + list(columns)]
+
+
+# Row-level samples of the given columns for per-river statistics: the
+# loaded dataset's bounded row sample, or from the sample store or database
+# an equal share of config.SAMPLE_ROWS for every river, read without
+# loading every row into memory
+@timed('river_samples')
+def river_samples(columns):
+    columns = list(dict.fromkeys(['Sample'] + list(columns)))
+    if config.DB_PATH or config.STORE_PATH:
+        per_river = max(2, config.SAMPLE_ROWS // max(len(river_severity()[0]), 1))
+        if config.DB_PATH:
+            from db import river_sample
+            return river_sample(config.DB_PATH, columns, per_river)
+        from store import sample_store
+        return sample_store(config.STORE_PATH, columns, per_river, config.CHUNK_ROWS)
+    return read_columns(columns)
+
+
+# Per-river mean scores with their severity class, classified once per
+# dataset and bins setting and shared read-only by every session
+@st.cache_resource(show_spinner=False, max_entries=4)
+@timed('river_severity')
+def _river_severity(key, setting):
+    rivers = river_means(score_cols)
+    bins = severity_bins(rivers['pollution_risk_score'].to_numpy(float), setting)
+    return rivers.assign(Severity=classify_severity(rivers['pollution_risk_score'], bins)), bins
+
+
+# (rivers, bins) for the current dataset and config.SEVERITY_BINS
+def river_severity():
+    return _river_severity(dataset_key(), config.SEVERITY_BINS)
+
+
+# One row per sampling station over every sample (see
+# spatial.station_summary), or None when the samples have no stations. The
+# loaded dataset keeps running sums per station, since its rows are only a
+# sample; the sample store and database sum their rows
+@timed('station_table')
+def station_table():
+    from spatial import station_aggregates, station_summary
+    if config.DB_PATH or config.STORE_PATH:
+        stations = station_aggregates(dataset_columns())
+        if stations is not None:
+            stations.update(read_columns(stations.keys + stations.columns))
+    else:
+        stations = current_dataset()[1].stations
+    return station_summary(stations) if stations is not None else None
+
+
+# The n stations with the highest mean risk score, with their river, sample
+# count and mean exceedances
+@timed('ranked_stations')
+def ranked_stations(n):
+    columns = [station_col, 'Sample', 'samples', 'exceedances_count', 'pollution_risk_score']
+    if config.DB_PATH:
+        from db import top_n
+        return top_n(config.DB_PATH, columns, n, table='stations')
+    return top_k(station_table(), 'pollution_risk_score', n)[columns].reset_index(drop=True)
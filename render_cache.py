@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+
+
+# Process-wide LRU cache of rendered matplotlib figures as PNG bytes, keyed by
+# slide and widget state. Figures are closed as soon as they are rendered so
+# a long-running server does not accumulate them in pyplot's figure manager.
+# Listeners are called with (key, png) for every figure served, which lets the
+# headless export collect a slide's images. When many sessions miss the same
+# key at once, one renders it and the others wait for its result
+class FigureCache:
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.render_seconds = 0.0
+        self.listeners = []
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, draw):
+        with self._lock:
+            png = self._entries.get(key)
+            if png is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+                pending = self._pending.get(key)
+                rendering = pending is None
+                if rendering:
+                    pending = self._pending[key] = threading.Event()
+
+        if png is None and not rendering:
+            pending.wait()
+            with self._lock:
+                png = self._entries.get(key)
+
+        # Render when this call owns the key, or when the owner failed or the
+        # entry was already evicted
+        if png is None:
+            start = time.perf_counter()
+            try:
+                png = render_png(draw())
+                self.put(key, png)
+            finally:
+                with self._lock:
+                    self.render_seconds += time.perf_counter() - start
+                if rendering:
+                    with self._lock:
+                        del self._pending[key]
+                    pending.set()
+
+        for listener in self.listeners:
+            listener(key, png)
+        return png
+
+    # Seed a rendered figure, e.g. from a prebuilt bundle
+    def put(self, key, png):
+        with self._lock:
+            self._entries[key] = png
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Same output settings as st.pyplot
+def render_png(fig):
+    import matplotlib.pyplot as plt
+
+    buffer = BytesIO()
+    try:
+        fig.savefig(buffer, format='png', dpi=200, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+figure_cache = FigureCache()
@@ -0,0 +1,99 @@
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from pipeline import risk_weights, exceed_cols
+
+
+# Candidate weight vectors (one row per scenario, one column per flag in
+# exceed_cols): the current weights each scaled by an independent uniform
+# factor in [1 - spread, 1 + spread]
+def random_weights(n, spread=0.5, seed=0, base=risk_weights):
+    rng = np.random.default_rng(seed)
+    base = np.array([base[flag] for flag in exceed_cols], dtype=float)
+    return base * rng.uniform(1 - spread, 1 + spread, size=(n, len(base)))
+
+
+# Score every river under every weight vector in one matrix multiply. A
+# river's mean risk score is linear in the weights, so with rates the
+# rivers x flags matrix of exceedance rates and weights the scenarios x flags
+# matrix, scores is rivers x scenarios. ranks holds 1 for the highest score
+# in each scenario; tied rivers share the best rank of the tie
+def sweep(rates, weights):
+    scores = np.asarray(rates, dtype=float) @ np.asarray(weights, dtype=float).T
+
+    order = np.argsort(-scores, axis=0, kind='stable')
+    ordered = np.take_along_axis(scores, order, axis=0)
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[1:] = ordered[1:] != ordered[:-1]
+    positions = np.where(starts, np.arange(1, len(scores) + 1)[:, None], 0)
+
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.maximum.accumulate(positions, axis=0), axis=0)
+    return scores, ranks
+
+
+# How much each river's rank moves across the scenarios, in current rank
+# order: the current score and rank, the mean, spread
+# and range of ranks, the share of scenarios that keep the current rank, and
+# the share that put the river in the top_k
+def rank_stability(df_rivers, weights, top_k=3, base=risk_weights):
+    rates = df_rivers[exceed_cols].to_numpy(float)
+    baseline = np.array([[base[flag] for flag in exceed_cols]], dtype=float)
+    base_scores, base_ranks = sweep(rates, baseline)
+    scores, ranks = sweep(rates, weights)
+
+    report = pd.DataFrame({
+        'Sample': df_rivers['Sample'].to_numpy(),
+        'score': base_scores[:, 0],
+        'rank': base_ranks[:, 0],
+        'mean_rank': ranks.mean(axis=1),
+        'rank_std': ranks.std(axis=1),
+        'best_rank': ranks.min(axis=1),
+        'worst_rank': ranks.max(axis=1),
+        'same_rank': (ranks == base_ranks).mean(axis=1),
+        f'top_{top_k}': (ranks <= top_k).mean(axis=1),
+    })
+    return report.sort_values('rank', kind='stable').reset_index(drop=True)
+
+
+def load_weights(path):
+    weights = pd.read_csv(path)
+    missing = [flag for flag in exceed_cols if flag not in weights]
+    if missing:
+        raise ValueError(f"{path} is missing weight columns: {', '.join(missing)}")
+    return weights[exceed_cols].to_numpy(float)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank stability of rivers under alternative risk-score weights.")
+    parser.add_argument('--weights', help="CSV of weight vectors, one per row, with a column per exceedance flag "
+                                          "(default: random perturbations of the current weights)")
+    parser.add_argument('--scenarios', type=int, default=10_000, help="random weight vectors (default: 10000)")
+    parser.add_argument('--spread', type=float, default=0.5,
+                        help="relative range of the random perturbations (default: 0.5)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--top', type=int, default=3, help="report the share of scenarios in the top N (default: 3)")
+    parser.add_argument('--out', help="write the report to this CSV file instead of printing it")
+    args = parser.parse_args(argv)
+
+    from pipeline import river_means
+
+    if args.weights:
+        weights = load_weights(args.weights)
+    else:
+        weights = random_weights(args.scenarios, args.spread, args.seed)
+    report = rank_stability(river_means(exceed_cols), weights, args.top)
+
+    if args.out:
+        report.to_csv(args.out, index=False)
+        print(f"Wrote rank stability over {len(weights)} scenarios to {args.out}")
+    else:
+        print(report.round(3).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,31 @@
+import importlib
+
+# Slide registry: sidebar title -> (module, function). Slide modules are
+# imported on first use, so their heavy dependencies (pandas, plotly, and
+# matplotlib for slide 9) only load when a slide needs them
+slide_options = {
+    "1: Title Slide": ('slides.intro', 'slide_1'),
+    "2: Why This Matters": ('slides.intro', 'slide_2'),
+    "3: Objectives": ('slides.intro', 'slide_3'),
+    "4: Chemical Pollutants & Standards": ('slides.intro', 'slide_4'),
+    "5: Dataset Overview": ('slides.data', 'slide_5'),
+    "6: Visualizing the Problem": ('slides.data', 'slide_6'),
+    "7: Pollution Risk Scores": ('slides.data', 'slide_7'),
+    "8: Health Impacts": ('slides.impacts', 'slide_8'),
+    "9: Generational & Regional Effects": ('slides.impacts', 'slide_9'),
+    "10: Ecosystem Damage": ('slides.impacts', 'slide_10'),
+    "11: Economic Consequences": ('slides.impacts', 'slide_11'),
+    "12: Severity Index & Rankings": ('slides.data', 'slide_12'),
+    "13: Recommendations for Action": ('slides.closing', 'slide_13'),
+    "14: Call to Action": ('slides.closing', 'slide_14'),
+    "15: Q&A / Acknowledgements": ('slides.closing', 'slide_15'),
+    "16: End of Presentation": ('slides.closing', 'slide_16')
+}
+
+# Titles in presentation order; navigation works on positions in this list
+slide_titles = list(slide_options)
+
+
+def load_slide(title):
+    module_name, function_name = slide_options[title]
+    return getattr(importlib.import_module(module_name), function_name)
@@ -0,0 +1,83 @@
+import streamlit as st
+
+
+# Recommendations for Action
+def slide_13():
+    st.markdown("## Recommendations for Action")
+    st.markdown("""
+    ### Policy Level:
+    - Ban illegal mining activities within 100m of water bodies
+    - Enforce stricter penalties for environmental violations
+    - Create protected buffer zones around critical water sources
+    
+    ### Community Level:
+    - Regular water quality testing and public reporting
+    - Community-based river clean-up programs
+    - Education on safe water practices and health risks
+    
+    ### Environmental Restoration:
+    - Invest in natural filtration wetlands
+    - River bank reforestation programs
+    - Remediation technologies for heavily contaminated areas
+    """)
+
+# Call to Action
+def slide_14():
+    st.markdown("## Call to Action")
+    st.markdown("""
+    ### Everyone has a role to play:
+    
+    - **Government:** Enforce mining regulations and invest in clean water
+    - **Citizens:** Report illegal mining and participate in clean-up efforts
+    - **Scientists:** Continue monitoring and developing solutions
+    - **Businesses:** Adopt responsible water usage practices
+    
+    > ### "Clean water = healthy people = strong economy"
+    
+    **Time is running out for these rivers—let's act together.**
+    """)
+
+# Q&A / Acknowledgements
+def slide_15():
+    st.markdown("## Thank You & Acknowledgements")
+    st.markdown("""
+    ### Acknowledgements:
+    - Ghana Water Resources Commission
+    - Environmental Protection Agency
+    
+    ### Contact Information:
+    - Email: Solomonafoh@gmail.com
+    
+    ### Questions?
+    """)
+    
+def slide_16():
+    st.markdown("## End of Presentation")
+    st.markdown("Thank you for your attention!")
+    st.markdown("### References")
+    st.markdown("""
+    World Bank. (2011). Ghana: Balancing economic growth and depletion of resources. Retrieved from https://blogs.worldbank.org/en/africacan/ghana-balancing-economic-growth-and-depletion-resources
+
+    Ghana Environmental Protection Agency. (2016). National Biodiversity Strategy and Action Plan. Retrieved from https://dev-chm.cbd.int/doc/world/gh/gh-nbsap-v2-en.pdf
+
+    Shao, K., et al. (2023). Bioaccumulation and trophic transfer of total mercury through the aquatic food web. Retrieved from https://www.sciencedirect.com/science/article/pii/S0048969723028310
+
+    Winrock International. (2021). Ghana Water Resources Profile Overview. Retrieved from https://winrock.org/resources/ghana-water-resources-profile/
+
+    Muntaka, A. (2020). Fisheries and Mangroves in Ghana: Atidza and the Densu Delta. Retrieved from https://muntaka.com/fishing-in-ghana-mangroves/
+
+    World Bank. (2012). Ghana loses GHC420 million annually due to poor sanitation. Retrieved from https://documents1.worldbank.org/curated/ar/786701468256742033/pdf/681220WSP0ESI00B000PUBLIC00brochure.pdf
+    
+    Agyemang, I. A., & Addai, A. (2023). Mining Activities and Their Effect on the Environment: A Case Study of Illegal Mining in the Eastern Region of Ghana. African Journal of Technical Education and Occupational Health (AJTEOH), 5(2), 66–79.
+    https://journal-iasssf.com/index.php/AJTEOH/article/download/395/651/6303
+
+    Tsekpo, M., & Ntiamoah, B. (2023). Analyzing Topographical and Socio-Economic Impacts of Illegal Gold Mining in Ghana's Ashanti and Eastern Regions Using Remote Sensing and Field Surveys.
+    ResearchGate.
+    https://www.researchgate.net/publication/375696718_Analyzing_Topographical_and_Socio-Economic_Impacts_of_Illegal_Gold_Mining_in_Ghana's_Ashanti_and_Eastern_Regions_Using_Remote_Sensing_and_Field_Surveys
+
+    Obiri, S., Agyemang, I., & Doyi, H. (2024). Impacts of Illegal Mining Activities on Water Quality for Irrigation and Domestic Purposes in Ghana. Journal of Water and Health, 22(10), 1886–1899.
+    https://iwaponline.com/jwh/article/22/10/1886/104786/Impacts-of-illegal-mining-activities-on-water
+
+    Ansong, J., & Asante, K. A. (2023). Assessment of Heavy Metal Pollution in Rivers Impacted by Illegal Mining Using Pollution Indices and Health Risk Models in Ghana. Environmental Pollution, 329, 122218.
+    https://www.sciencedirect.com/science/article/abs/pii/S0269749123021942
+    """)
@@ -0,0 +1,477 @@
+from functools import partial
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+import config
+from pipeline import (thresholds, measurement_cols, exceed_cols, agg_cols, time_col, station_col, lat_col, lon_col,
+                      dataset_key, dataset_columns, lab_data_loaded, current_dataset, read_columns, river_means,
+                      river_rows, river_samples, river_severity, ranked_stations, station_table, top_k)
+from bootstrap import bootstrap_intervals
+from bundle import saved_results
+from boxstats import box_summary
+from cluster import linkage_order
+from compact import memory_report
+from scenarios import random_weights, rank_stability
+from spatial import GridIndex, bin_stations, viewport, zoom_cell_deg
+from timeseries import river_series
+
+
+# Dataset Overview
+def slide_5():
+    st.markdown("## Dataset Overview")
+
+    st.markdown("""
+    This dataset gives us a snapshot of water quality in **12 major rivers** across Ghana's mining regions. 
+
+    **Why the data matters:**
+    - Rivers are essential for **drinking water, farming, and fishing**. Pollution affects livelihoods and health.
+    - **Illegal mining (Galamsey)** introduces dangerous substances into these waters.
+
+    **What's in the dataset?**
+    - 🏞️ **Multiple samples** were collected from the same rivers at **different locations or times** to get a more accurate picture.
+    - We measured:
+        - 🧪 **Heavy metals**: *Arsenic, Lead, Cadmium, Chromium* – toxic even in tiny amounts.
+        - 🌊 **Water properties**: *pH, TDS, Conductivity* – these indicate general water quality.
+        - 💧 **Hardness**: Levels of *Calcium* and *Magnesium*, which affect water usability and safety.
+
+    **Extra insight:**
+    - 🚩 "Exceedance flags" show if pollutant levels go **above safe limits** (set by WHO and Ghana EPA).
+    - ✅ We also calculated a **pollution risk score** to simplify interpretation.
+
+    Data was collected through **field sampling and laboratory analysis**.
+    """)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### Measured Water Quality")
+        measurement_cols = ['As (mg/L)', 'Cd (mg/L)', 'Cr (mg/L)', 'Pb (mg/L)', 'pH', 'TDS (mg/L)', 
+                            'Conductivity (µS/cm)', 'Hardness (mg/L)', 'Ca Hardness (mg/L)', 'Mg Hardness (mg/L)']
+        st.dataframe(read_columns(['Sample'] + measurement_cols, limit=13))
+
+    with col2:
+        st.markdown("### Exceedance Flags (Above Safe Limits)")
+        exceed_cols = ['As_exceed', 'Cd_exceed', 'Cr_exceed', 'Pb_exceed', 'pH_exceed', 'TDS_exceed', 
+                       'Conductivity_exceed', 'Hardness_exceed', 'Ca_Hardness_exceed', 'Mg_Hardness_exceed']
+        st.dataframe(read_columns(['Sample'] + exceed_cols, limit=13))
+
+    # Memory saved by the compact in-memory layout
+    if (config.COMPACT or config.BUNDLE_PATH) and not (config.STORE_PATH or config.DB_PATH):
+        report = memory_report(current_dataset()[0])
+        if report:
+            st.caption(report)
+
+    st.markdown("""
+    > ℹ️ **Note**: Some rivers appear more than once because **multiple locations were sampled** to capture local variations in pollution levels.
+    > ⚠️ If a value is marked `True`, it means that pollutant exceeded recommended safety limits — these are the critical areas of concern.
+    """)
+
+
+# Heatmap of every parameter per river, rows and columns in clustered order.
+# Values are read off on hover; cells are only annotated for a few rivers
+def draw_parameter_heatmap(matrix, title, label):
+    fig = px.imshow(matrix, color_continuous_scale='Reds', zmin=0, zmax=1, aspect='auto',
+                    text_auto='.2f' if len(matrix) <= 30 else False,
+                    labels=dict(x="Parameter", y="River", color=label), title=title)
+    fig.update_layout(height=min(max(400, 16 * len(matrix)), 1200))
+    return fig
+
+
+# Box chart of one pollutant per river from precomputed box statistics, so
+# only one box per river and the capped outliers reach the browser
+def draw_pollutant_boxplot(stats, outliers, pollutant):
+    fig = go.Figure(go.Box(
+        x=stats['Sample'], q1=stats['q1'], median=stats['median'], q3=stats['q3'],
+        lowerfence=stats['lowerfence'], upperfence=stats['upperfence'],
+        name=pollutant, boxpoints=False
+    ))
+    fig.add_trace(go.Scatter(x=outliers['Sample'], y=outliers[pollutant], mode='markers',
+                             name="Outliers", marker=dict(size=4, color='gray')))
+
+    # Add threshold line(s)
+    if pollutant == 'pH':
+        fig.add_hline(y=thresholds['pH_min'], line_dash='dash', line_color='red',
+                      annotation_text=f"Min Limit: {thresholds['pH_min']}")
+        fig.add_hline(y=thresholds['pH_max'], line_dash='dash', line_color='red',
+                      annotation_text=f"Max Limit: {thresholds['pH_max']}")
+    else:
+        fig.add_hline(y=thresholds[pollutant], line_dash='dash', line_color='red',
+                      annotation_text=f"Limit: {thresholds[pollutant]}")
+
+    fig.update_layout(title=f"{pollutant} Levels Across Rivers", height=600, showlegend=False,
+                      xaxis_title='Sample', yaxis_title=pollutant)
+    fig.update_xaxes(tickangle=90)
+    return fig
+
+
+boxplot_pollutants = ['As (mg/L)', 'Cd (mg/L)', 'Cr (mg/L)', 'Pb (mg/L)', 'pH', 'TDS (mg/L)']
+
+
+# River x parameter matrix of exceedance rates, or of mean concentrations
+# scaled to 0-1 per parameter, with rows and columns in hierarchical
+# clustering order; computed once per dataset and measure
+@st.cache_data(show_spinner="Clustering rivers...", max_entries=8)
+def clustered_matrix(key, measure):
+    saved = saved_results.get(('clustered_matrix', key, measure))
+    if saved is not None:
+        return saved
+    if measure == 'rates':
+        matrix = river_means(exceed_cols).set_index('Sample')
+        matrix.columns = [col.removesuffix('_exceed').replace('_', ' ') for col in matrix.columns]
+    else:
+        matrix = river_means(measurement_cols).set_index('Sample')
+        low, spread = matrix.min(), matrix.max() - matrix.min()
+        matrix = (matrix - low) / spread.where(spread > 0, 1)
+    return matrix.iloc[linkage_order(matrix), linkage_order(matrix.T)]
+
+
+# Box statistics per dataset, pollutant and outlier budget; only the
+# selected pollutant is read
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_box_summary(key, pollutant, max_outliers):
+    saved = saved_results.get(('box_summary', key, pollutant, max_outliers))
+    if saved is not None:
+        return saved
+    return box_summary(read_columns(['Sample', pollutant]), pollutant, max_outliers)
+
+
+# Slide 6 results a bundle build computes ahead of time, as (saved_results
+# key, compute); each result is a frame or a tuple of frames
+def bundled_results(key):
+    results = [(('clustered_matrix', key, measure), partial(clustered_matrix, key, measure))
+               for measure in ('rates', 'concentrations')]
+    results += [(('box_summary', key, pollutant, config.BOX_OUTLIERS),
+                 partial(cached_box_summary, key, pollutant, config.BOX_OUTLIERS))
+                for pollutant in boxplot_pollutants]
+    return results
+
+
+# Downsampled once per dataset, river, parameter and point budget; only that
+# river's timestamps, stations and parameter are read
+@st.cache_data(show_spinner="Reading river samples...", max_entries=64)
+def cached_river_series(key, columns, river, column, budget):
+    rows = river_rows(['Sample', column] + [col for col in (time_col, station_col) if col in columns], river)
+    series = river_series(rows, river, column, budget)
+    series.attrs['sampled'] = rows.attrs.get('sampled', False)
+    return series
+
+
+# Table of the stations with coordinates and its grid index, built once per
+# dataset from every sample and shared read-only by every session
+@st.cache_resource(show_spinner=False, max_entries=2)
+def station_index(key, columns):
+    stations = station_table().dropna(subset=[lat_col, lon_col]).reset_index(drop=True)
+    return stations, GridIndex(stations[lat_col], stations[lon_col])
+
+
+def sampling_site_map(key, columns):
+    stations, index = station_index(key, columns)
+    if stations.empty:
+        return
+
+    st.markdown("### Sampling Sites")
+
+    col1, col2, col3 = st.columns(3)
+    center = col1.selectbox("Center on station:", stations[station_col])
+    zoom = col2.slider("Map zoom:", 5, 14, 7)
+    radius_km = col3.slider("Nearby radius (km):", 1, 100, 20)
+
+    site = stations.loc[stations[station_col] == center].iloc[0]
+    lat, lon = site[lat_col], site[lon_col]
+
+    # Bin only the stations in view, with bins that shrink as the map zooms in
+    visible = index.bbox(*viewport(lat, lon, zoom))
+    bins = bin_stations(stations, visible, zoom_cell_deg(zoom))
+
+    col1, col2 = st.columns([1.3, 0.7])
+
+    with col1:
+        fig = px.scatter_map(
+            bins, lat=lat_col, lon=lon_col,
+            size='stations', color='pollution_risk_score',
+            color_continuous_scale='Reds', size_max=30,
+            hover_data={'stations': True, 'samples': True, 'exceedances_count': ':.2f',
+                        'pollution_risk_score': ':.2f', lat_col: False, lon_col: False},
+            center={'lat': lat, 'lon': lon}, zoom=zoom, height=500,
+            title=f"Risk by Area ({len(visible)} stations in view)"
+        )
+        fig.update_layout(map_style='open-street-map')
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        positions, distance = index.radius(lat, lon, radius_km)
+        nearby = stations.iloc[positions][[station_col, 'Sample', 'samples', 'exceedances_count',
+                                           'pollution_risk_score']].assign(**{'distance (km)': distance})
+        st.markdown(f"**Stations within {radius_km} km of {center}**")
+        st.dataframe(nearby.round(2), use_container_width=True, hide_index=True)
+
+
+# Visualizing the Problem
+def slide_6():
+    st.markdown("## Visualizing the Problem")
+
+    key = dataset_key()
+    columns = tuple(dataset_columns())
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Heatmap of every parameter; the clustered order is kept when
+        # focusing on a subset of rivers
+        measure = st.radio("Heatmap of:", ["Exceedance rate", "Normalized concentration"], horizontal=True)
+        if measure == "Exceedance rate":
+            matrix = clustered_matrix(key, 'rates')
+            title, label = "Pollutant Exceedances by River", "Share of samples"
+        else:
+            matrix = clustered_matrix(key, 'concentrations')
+            title, label = "Pollutant Levels by River (scaled per parameter)", "Scaled level"
+        focus = st.multiselect("Focus on rivers (all when empty):", matrix.index)
+        if focus:
+            matrix = matrix[matrix.index.isin(focus)]
+        st.plotly_chart(draw_parameter_heatmap(matrix, title, label), use_container_width=True)
+    
+    with col2:
+        # Dropdown to select pollutant for boxplot
+        pollutant = st.selectbox(
+            "Select pollutant to visualize:",
+            boxplot_pollutants
+        )
+        
+        stats, outliers = cached_box_summary(key, pollutant, config.BOX_OUTLIERS)
+        st.plotly_chart(draw_pollutant_boxplot(stats, outliers, pollutant), use_container_width=True)
+        
+    st.markdown("""
+    **Interpretation:**
+    - Several rivers show multiple pollutant exceedances
+    - Heavy metals (especially Arsenic and Lead) are the most frequently exceeded standards
+    - Mining-heavy regions show the highest contamination levels
+    - Galamsey Pit and rivers in active mining areas consistently exceed safety thresholds
+    """)
+
+    # Only lab files with sample timestamps have a time dimension
+    if time_col in columns:
+        st.markdown("### Trends Over Time")
+
+        col1, col2 = st.columns(2)
+        river = col1.selectbox("Select river:", river_means(['pollution_risk_score'])['Sample'])
+        parameter = col2.selectbox(
+            "Select parameter:",
+            ['As (mg/L)', 'Cd (mg/L)', 'Cr (mg/L)', 'Pb (mg/L)', 'pH', 'TDS (mg/L)'],
+            key='trend_parameter'
+        )
+
+        series = cached_river_series(key, columns, river, parameter, config.SERIES_POINTS)
+        fig = px.line(series, x=time_col, y=parameter, color=station_col,
+                      title=f"{parameter} in {river} by Station")
+        if parameter == 'pH':
+            fig.add_hline(y=thresholds['pH_min'], line_dash='dash', line_color='red')
+            fig.add_hline(y=thresholds['pH_max'], line_dash='dash', line_color='red')
+        else:
+            fig.add_hline(y=thresholds[parameter], line_dash='dash', line_color='red')
+        st.plotly_chart(fig, use_container_width=True)
+        if series.attrs['sampled']:
+            st.caption(f"Drawn from the dataset's row sample (at most {config.SAMPLE_ROWS:,} rows across all "
+                       "rivers), not from every sample of this river.")
+
+    # Only lab files with station coordinates have a map
+    if lat_col in columns and lon_col in columns:
+        sampling_site_map(key, columns)
+
+# Example data with more than 3 rivers
+data1 = {
+    'Sample': ['Densu River', 'Pra River', 'Ankobrah River', 'Volta River', 'Tano River', 'Offin River', 'Birim River'],
+    'pollution_risk_score': [11.2, 7.5, 3.4, 5.1, 4.2, 8.0, 2.9],
+    'exceedances_count': [5, 3, 2, 4, 3, 6, 1]
+}
+
+
+def slide_7():
+    st.markdown("## Pollution Risk Scores")
+
+    # Use the real per-river results whenever lab data is loaded
+    if lab_data_loaded():
+        df_rivers1 = river_means(['pollution_risk_score', 'exceedances_count'])
+    else:
+        df_rivers1 = pd.DataFrame(data1)
+
+    # Assuming df_rivers is your DataFrame containing all rivers.
+    # Sort rivers by pollution risk score (descending)
+    sorted_rivers = df_rivers1.sort_values('pollution_risk_score', ascending=False)
+
+    # ---- BAR CHART: Pollution Risk Score by River ----
+    fig_bar = px.bar(
+        sorted_rivers,
+        x='Sample',
+        y='pollution_risk_score',
+        color='pollution_risk_score',
+        color_continuous_scale='Reds',
+        title="Pollution Risk Score by River"
+    )
+    fig_bar.update_layout(
+        xaxis_title="River",
+        yaxis_title="Risk Score",
+        xaxis_tickangle=45,
+        xaxis={'categoryorder': 'total descending'}
+    )
+    st.plotly_chart(fig_bar, use_container_width=True)
+
+    # ---- SPLIT: Bubble chart (left) + Text explanation (right) ----
+    col1, col2 = st.columns([1.3, 0.7])
+
+    with col1:
+        fig_scatter = px.scatter(
+            df_rivers1,
+            x='exceedances_count',
+            y='pollution_risk_score',
+            size='pollution_risk_score',
+            color='Sample',
+            hover_name='Sample',
+            title="Exceedances vs. Pollution Risk",
+            labels={
+                'exceedances_count': 'No. of Standards Exceeded',
+                'pollution_risk_score': 'Risk Score'
+            }
+        )
+        fig_scatter.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+        fig_scatter.update_layout(
+            xaxis=dict(title='No. of Standards Exceeded'),
+            yaxis=dict(title='Pollution Risk Score')
+        )
+        st.plotly_chart(fig_scatter, use_container_width=True)
+
+    with col2:
+        st.markdown("""
+        ### 💡 How to Interpret the Risk Score
+
+        The **pollution risk score** tells us how dangerous a river sample is. It’s based on:
+        - ✅ How **many pollutants** exceed safe limits
+        - ⚠️ How **toxic** each pollutant is
+        - 🔁 How **frequently** the exceedances occur
+
+        #### Score Ranges:
+        - 🔴 **Above 10**: Extremely polluted
+        - 🟠 **5–10**: High pollution
+        - 🟡 **2–5**: Moderate pollution
+        - 🟢 **Below 2**: Low pollution
+
+        Rivers with the highest scores need urgent action.
+        """)
+
+
+# Rank stability for one dataset and sweep configuration
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_rank_stability(key, scenarios, spread):
+    df_rivers = river_means(exceed_cols)
+    return rank_stability(df_rivers, random_weights(scenarios, spread))
+
+
+# Bootstrap intervals of every per-river mean, once per dataset
+@st.cache_data(show_spinner="Resampling river samples...", max_entries=4)
+def cached_intervals(key, replicates):
+    return bootstrap_intervals(river_samples(agg_cols), agg_cols, replicates)
+
+
+# Severity Index & Rankings
+def slide_12():
+    st.markdown("## Severity Index & Rankings")
+
+    # Rivers by pollution risk score (descending), with the severity classes
+    # computed once per dataset; long lists show only the top rivers
+    rivers, bins = river_severity()
+    n = None
+    if len(rivers) > 30:
+        n = st.slider("Rivers to show:", 10, len(rivers), 30)
+    ranked_df = top_k(rivers, 'pollution_risk_score', n)[['Sample', 'pollution_risk_score', 'Severity']]
+
+    # Off by default with the sample store and database, where drawing the
+    # rows to resample scans every sample
+    show_intervals = st.checkbox("Show 95% confidence intervals", value=not (config.DB_PATH or config.STORE_PATH))
+
+    # Create color-coded bar chart
+    fig = px.bar(
+        ranked_df,
+        x='Sample',
+        y='pollution_risk_score',
+        color='Severity',
+        color_discrete_map={'Low': 'green', 'Medium': 'orange', 'High': 'red'},
+        title="Pollution Severity Ranking of River Samples (High to Low)",
+        hover_data={
+            'Sample': True,
+            'pollution_risk_score': ':.2f',
+            'Severity': True
+        }
+    )
+    fig.update_layout(
+        xaxis_title="River Sample",
+        yaxis_title="Pollution Risk Score",
+        legend_title="Severity Level",
+        xaxis_tickangle=-45
+    )
+
+    # 95% bootstrap intervals of each river's mean score. Point and interval
+    # both come from the row-level samples that were resampled, which for a
+    # large lab file are a subset, so they are drawn as their own markers
+    # rather than as error bars on the full-data bars
+    if show_intervals:
+        intervals = cached_intervals(dataset_key(), 2000)
+        risk = intervals[intervals['parameter'] == 'pollution_risk_score'].set_index('Sample')
+        risk = risk.reindex(ranked_df['Sample']).dropna(subset=['mean'])
+        fig.add_trace(go.Scatter(
+            x=risk.index, y=risk['mean'], mode='markers', name="Sample mean (95% CI)",
+            marker=dict(symbol='diamond', color='black', size=7),
+            error_y=dict(array=(risk['upper'] - risk['mean']).clip(lower=0),
+                         arrayminus=(risk['mean'] - risk['lower']).clip(lower=0))
+        ))
+    st.plotly_chart(fig, use_container_width=True)
+
+    if show_intervals:
+        with st.expander("Confidence intervals for every measurement"):
+            interval = intervals['lower'].round(3).astype(str) + ' – ' + intervals['upper'].round(3).astype(str)
+            table = intervals.assign(interval=interval.where(intervals['lower'].notna(), '—'))
+            st.dataframe(table.pivot(index='Sample', columns='parameter', values='interval')[agg_cols],
+                         use_container_width=True)
+            st.caption("Percentile intervals of the mean from 2,000 bootstrap resamples of each river's "
+                       f"samples, from a sample of at most {config.SAMPLE_ROWS:,} rows. Rivers sampled once "
+                       "have no interval.")
+
+    # What-if analysis over alternative risk weights
+    with st.expander("What if the risk weights were different?"):
+        col1, col2 = st.columns(2)
+        scenarios = col1.select_slider("Weight scenarios:", [100, 1_000, 10_000, 50_000], value=10_000)
+        spread = col2.slider("Weight variation (±%):", 10, 90, 50, step=10)
+
+        report = cached_rank_stability(dataset_key(), scenarios, spread / 100)
+        st.dataframe(
+            report.rename(columns={
+                'score': 'Risk Score', 'rank': 'Rank', 'mean_rank': 'Mean Rank', 'rank_std': 'Rank Std',
+                'best_rank': 'Best Rank', 'worst_rank': 'Worst Rank', 'same_rank': 'Keeps Rank', 'top_3': 'In Top 3'
+            }).round(2),
+            use_container_width=True, hide_index=True
+        )
+        st.caption(f"Each weight is varied independently by up to ±{spread}% across {scenarios:,} scenarios. "
+                   "Rivers with a narrow rank range are ranked robustly; wide ranges mean the ranking "
+                   "depends on the chosen weights.")
+
+    # Station-level ranking for lab files with station IDs
+    if station_col in dataset_columns():
+        st.markdown("### Highest-Risk Stations")
+        n = st.slider("Stations to show:", 5, 50, 10)
+        st.dataframe(ranked_stations(n).round(2), use_container_width=True, hide_index=True)
+
+    # Interpretation guidance
+    low, high = bins[1], bins[2]
+    st.markdown(f"""
+    ### 🛠️ Intervention Priority
+
+    - 🟥 **High Severity (Score > {high:g})**:  
+      Immediate mitigation required — high pollution and potential health/ecosystem risks.
+    
+    - 🟧 **Medium Severity (Score {low:g}–{high:g})**:  
+      Needs regular monitoring and early intervention to prevent escalation.
+    
+    - 🟩 **Low Severity (Score < {low:g})**:  
+      Maintain current water quality through protection and proactive management.
+    """)
@@ -0,0 +1,472 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from figures import figure_registry
+from render_cache import figure_cache
+
+
+# Health Impacts figures and tables, built once per process by figure_registry
+@figure_registry.register('slide_8/health_table')
+def build_health_table():
+    health_data = {
+        "Pollutant": [
+            "Arsenic (As)",
+            "Mercury (Hg)",
+            "Cadmium (Cd)",
+            "Lead (Pb)",
+            "Chromium (Cr)"
+        ],
+        "Known Diseases": [
+            "Skin lesions, cancers (skin, lung, bladder), heart diseases",
+            "Nerve damage, kidney failure",
+            "Kidney disease, bone problems, cancers",
+            "Learning difficulties, memory loss in children",
+            "Breathing issues, skin rashes, lung cancer"
+        ],
+        "Short-Term Impact": [
+            "Stomach pain, vomiting, diarrhea",
+            "Shaking hands, confusion, mood swings",
+            "Nausea, belly pain",
+            "Tiredness, headaches, stomach aches",
+            "Coughing, skin irritation"
+        ],
+        "Long-Term Impact": [
+            "Cancer, diabetes, heart disease",
+            "Memory loss, kidney failure",
+            "Weak bones, kidney damage",
+            "Slow brain development in children",
+            "Lung cancer, breathing problems"
+        ]
+    }
+    return pd.DataFrame(health_data)
+
+
+@figure_registry.register('slide_8/radar')
+def build_impact_radar():
+    impact_data = {
+        'Category': ['Nervous System', 'Kidneys', 'Heart', 'Reproduction', 'Skin', 'Digestion'],
+        'Arsenic': [5, 6, 8, 5, 9, 7],
+        'Mercury': [9, 8, 5, 8, 3, 6],
+        'Cadmium': [4, 9, 5, 7, 4, 5],
+        'Lead': [9, 6, 7, 8, 2, 5],
+        'Chromium': [3, 5, 4, 6, 8, 3]
+    }
+    impact_df = pd.DataFrame(impact_data)
+
+    impact_long_df = impact_df.melt(
+        id_vars='Category',
+        var_name='Pollutant',
+        value_name='Severity'
+    )
+
+    fig_radar = px.line_polar(
+        impact_long_df,
+        r='Severity',
+        theta='Category',
+        color='Pollutant',
+        line_close=True,
+        title="Impact of Pollutants on Body Systems",
+        color_discrete_sequence=px.colors.qualitative.Bold,
+        labels={'Severity': 'Impact Level (1–10)'}
+    )
+    fig_radar.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 10])),
+        legend_title_text='Pollutant'
+    )
+    return fig_radar
+
+
+@figure_registry.register('slide_8/costs')
+def build_cost_bar():
+    cost_data = {
+        'Disease': [
+            'Skin Cancer',
+            'Kidney Disease',
+            'Neurological Disorders',
+            'Developmental Issues',
+            'Respiratory Disease'
+        ],
+        'Annual Cost per Patient (USD)': [
+            'N/A',
+            5300,
+            'N/A',
+            'N/A',
+            1741
+        ]
+    }
+    cost_df = pd.DataFrame(cost_data)
+
+    fig_bar = px.bar(
+        cost_df,
+        x='Annual Cost per Patient (USD)',
+        y='Disease',
+        color='Disease',
+        orientation='h',
+        title="Estimated Yearly Healthcare Costs per Patient",
+        color_discrete_sequence=px.colors.qualitative.Safe
+    )
+    fig_bar.update_layout(showlegend=False)
+    return fig_bar
+
+
+# Health Impacts
+def slide_8():
+    st.markdown("## Health Impacts of Water Pollution")
+
+    tab1, tab2 = st.tabs(["📋 Health Impact Table", "📊 Impact Visualization"])
+
+    # --- Tab 1: Health Impact Table ---
+    with tab1:
+        st.dataframe(figure_registry.get('slide_8/health_table'), use_container_width=True)
+
+    # --- Tab 2: Visualizations ---
+    with tab2:
+        col1, col2 = st.columns(2)
+
+        # --- Radar Chart: Health System Impact Severity ---
+        with col1:
+            st.plotly_chart(figure_registry.get('slide_8/radar'), use_container_width=True)
+
+        # --- Bar Chart: Healthcare Costs ---
+        with col2:
+            st.plotly_chart(figure_registry.get('slide_8/costs'), use_container_width=True)
+
+        st.markdown("""
+        **💬 Notes on Cost Data:**  
+        - Kidney disease treatment (like dialysis) can cost around \$5,300 per year.  
+        - Asthma treatment (used here as a proxy for respiratory disease) costs roughly \$1,741 yearly per patient.  
+        - Costs for cancer and neurological issues are harder to estimate in Ghana due to limited national data.
+        - Ghana spends only **4.15% of its GDP** on health – below the average for developing countries.
+        """)
+
+    # --- Summary of Key Insights ---
+    st.markdown("""
+    ### 🔍 Key Takeaways
+
+    - **Most dangerous effects:** Cancer, kidney failure, and brain damage are among the most serious health threats.
+    - **Children at greatest risk:** Kids absorb more heavy metals than adults — putting them at higher risk for lifelong health issues.
+    - **Health system strain:** Many pollution-related illnesses are expensive to treat, and Ghana’s health spending is limited.
+    - **We need better data:** Some impacts, especially on mental development and cancer, are under-researched locally.
+    """)
+
+   
+# Flowchart-like visualization of the generational impact pathway
+def draw_generational_pathway():
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 3))
+
+    # Turn off the axis
+    ax.axis('off')
+
+    # Define the boxes and arrows
+    boxes = [
+        (0.1, 0.5, 0.15, 0.3, "Water\nPollution"),
+        (0.35, 0.5, 0.15, 0.3, "Maternal\nExposure"),
+        (0.6, 0.5, 0.15, 0.3, "Fetal\nDevelopment\nImpact"),
+        (0.85, 0.5, 0.15, 0.3, "Lifelong\nHealth\nEffects")
+    ]
+
+    arrows = [
+        (0.25, 0.65, 0.35, 0.65),
+        (0.5, 0.65, 0.6, 0.65),
+        (0.75, 0.65, 0.85, 0.65)
+    ]
+
+    # Draw the boxes
+    for x, y, w, h, label in boxes:
+        ax.add_patch(plt.Rectangle((x, y), w, h, fill=True, color='lightblue', alpha=0.7))
+        ax.text(x + w/2, y + h/2, label, ha='center', va='center', fontweight='bold')
+
+    # Draw the arrows
+    for x1, y1, x2, y2 in arrows:
+        ax.annotate("", xy=(x2, y2), xytext=(x1, y1),
+                   arrowprops=dict(arrowstyle="->", lw=2, color='blue'))
+
+    return fig
+
+
+def pathway_figure():
+    return ('slide_9', 'pathway'), draw_generational_pathway
+
+
+# Matplotlib figures a bundle build renders ahead of time, as (figure_cache
+# key, draw)
+def static_figures(key):
+    return [pathway_figure()]
+
+
+# Generational & Regional Effects figures, built once per process by figure_registry
+@figure_registry.register('slide_9/vulnerability')
+def build_vulnerability_bar():
+    # Updated vulnerability scores based on recent findings
+    vulnerability_data = {
+        'Group': ['Children', 'Pregnant Women', 'Farmers', 'Fishers', 'General Population'],
+        'Vulnerability Score': [9.2, 8.7, 7.5, 8.3, 5.4]
+    }
+
+    df_vuln = pd.DataFrame(vulnerability_data)
+
+    # Create horizontal bar chart
+    fig = px.bar(
+        df_vuln,
+        x='Vulnerability Score',
+        y='Group',
+        orientation='h',
+        title="Vulnerability to Water Pollution (Scale 1-10)",
+        color='Vulnerability Score',
+        color_continuous_scale='Reds',
+        text_auto='.1f'
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+@figure_registry.register('slide_9/regions')
+def build_region_bar():
+    # Updated regional impact data based on recent findings
+    region_data = {
+        'Region': ['Eastern Region', 'Ashanti Region', 'Western Region', 'Central Region', 
+                  'Western North', 'Bono East', 'Upper East', 'Ahafo'],
+        'Impact Score': [9.0, 8.7, 8.5, 6.2, 7.8, 6.5, 5.2, 7.3],
+        'Primary Mining Activity': ['Galamsey', 'Mixed Mining', 'Large-scale & Galamsey', 
+                                    'Moderate Galamsey', 'Large-scale Mining', 'Small-scale Legal', 
+                                    'Small-scale Mining', 'Mixed Mining']
+    }
+
+    df_region = pd.DataFrame(region_data)
+
+    # Bar chart for regional impacts
+    fig = px.bar(
+        df_region.sort_values('Impact Score', ascending=False),
+        x='Region',
+        y='Impact Score',
+        color='Primary Mining Activity',
+        title="Pollution Impact by Mining Region",
+        hover_data=['Primary Mining Activity'],
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+    fig.update_layout(xaxis={'categoryorder':'total descending'})
+    return fig
+
+
+# Generational & Regional Effects
+def slide_9():
+    st.markdown("## Generational & Regional Effects")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### Vulnerability by Population Group")
+
+        st.plotly_chart(figure_registry.get('slide_9/vulnerability'), use_container_width=True)
+
+    with col2:
+        st.markdown("### Regional Impact Severity")
+
+        st.plotly_chart(figure_registry.get('slide_9/regions'), use_container_width=True)
+
+    st.markdown("### Generational Impact Pathway")
+
+    png = figure_cache.get(*pathway_figure())
+    st.image(png, use_container_width=True)
+
+    st.markdown("""
+    ### Regional & Generational Findings:
+
+    - **Highest risk regions:** Eastern and Ashanti Regions exhibit critical levels of mercury and arsenic contamination due to intensive galamsey activities.
+    - **Mining correlation:** Areas with prevalent illegal mining show significantly higher pollution levels, adversely affecting water quality and public health.
+    - **Generational transfer:** Studies have detected heavy metals in umbilical cord blood, indicating prenatal exposure and potential long-term health effects.
+    - **Long-term consequences:** Children born in high-exposure areas are at increased risk of developmental delays and other health issues.
+    """)
+
+    st.markdown("""
+    ### References
+
+    - Obiri, S. et al. (2024). *Impacts of illegal mining activities on water quality for irrigation and domestic purposes*. Journal of Water and Health. [Link](https://iwaponline.com/jwh/article/22/10/1886/104786/Impacts-of-illegal-mining-activities-on-water)
+    - Cross Catholic Outreach. (2021). *Water Crisis in Ghana*. [Link](https://crosscatholic.org/blogs/2021/12/water-crisis-in-ghana/)
+    - National Institutes of Health. (2023). *Heavy Metals in Umbilical Cord Blood: Effects on Epigenetics and Child Health*. [Link](https://pmc.ncbi.nlm.nih.gov/articles/PMC11544782/)
+    - Nature Scientific Reports. (2023). *Effects of heavy metal exposure during pregnancy on birth outcomes*. [Link](https://www.nature.com/articles/s41598-023-46271-0)
+    """)
+
+
+# Ecosystem Damage figures and tables, built once per process by figure_registry
+@figure_registry.register('slide_10/ecosystem_table')
+def build_ecosystem_table():
+    eco_data = {
+        "Pollutant": ["Arsenic", "Mercury", "Cadmium", "Lead", "Chromium", "pH Imbalance", "TDS"],
+        "Aquatic Life Impact": [
+            "Bioaccumulates; enzyme disruption and reproductive failure",
+            "Neurotoxic methylmercury impairs growth and reproduction",
+            "Gill damage, reduced growth, lower survival rates",
+            "Neurological and muscular dysfunction",
+            "Gill tissue damage, stunted growth",
+            "High acidity kills sensitive aquatic species",
+            "Disrupts osmoregulation; reduces fish health"
+        ],
+        "Environmental Impact": [
+            "Soil/crop contamination; long-term sediment persistence (10+ yrs)",
+            "Accumulates in sediment and fish (up to 2.5 ppm); 15–30 years to clear",
+            "Soil degradation, yield losses; 20-year recovery",
+            "Lead in sediment persists 25+ years; affects biodiversity",
+            "Long-term toxicity in sediments (~15 years)",
+            "Acid mine drainage alters soil and water pH for 3–7 years",
+            "High levels signal heavy metal presence; clears in 1–5 years"
+        ],
+        "Recovery Time (years)": [10, 15, 20, 25, 15, 5, 3]
+    }
+    return pd.DataFrame(eco_data)
+
+
+@figure_registry.register('slide_10/biodiversity')
+def build_biodiversity_bar():
+    fig = px.bar(
+        pd.DataFrame({
+            "Category": ["Freshwater Vertebrates"],
+            "Decline (%)": [85]
+        }),
+        x="Category", y="Decline (%)", text="Decline (%)",
+        title="Global Freshwater Biodiversity Decline since 1970"
+    )
+    return fig
+
+
+@figure_registry.register('slide_10/bioaccumulation')
+def build_bioaccumulation_bar():
+    bioaccum_df = pd.DataFrame({
+        "Organism": [
+            "Water", "Sediment", "Primary Producer",
+            "Primary Consumer", "Secondary Consumer",
+            "Tertiary Consumer", "Human"
+        ],
+        "Hg (ppm)": [0.001, 0.05, 0.2, 0.8, 2.5, 4.0, 1.2]  # Obiri et al., 2024
+    })
+    fig = px.bar(
+        bioaccum_df,
+        x="Organism", y="Hg (ppm)",
+        title="Mercury Bioaccumulation in Ghanaian Food Chain",
+        log_y=True, text="Hg (ppm)"
+    )
+    fig.update_layout(yaxis_title="Mercury Level (ppm, log scale)")
+    return fig
+
+
+def slide_10():
+    st.markdown("## Ecosystem Damage")
+
+    tab1, tab2 = st.tabs(["Ecosystem Impact Data", "Biodiversity & Bioaccumulation"])
+
+    # Tab 1: Ecosystem Impact Data
+    with tab1:
+        st.dataframe(figure_registry.get('slide_10/ecosystem_table'), use_container_width=True)
+
+    # Tab 2: Biodiversity & Bioaccumulation
+    with tab2:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.plotly_chart(figure_registry.get('slide_10/biodiversity'), use_container_width=True)
+
+        with col2:
+            st.plotly_chart(figure_registry.get('slide_10/bioaccumulation'), use_container_width=True)
+
+    # Ecosystem Services Impacted
+    st.markdown("### Ecosystem Services Impacted")
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Primary Forest Loss (2002–2020)", "9.3 %")
+        st.caption("Source: Global Forest Watch")
+
+    with col2:
+        st.metric("Wetland Loss (1970–2020)", "35 %")
+        st.caption("Source: Ramsar Global Wetland Outlook")
+
+    with col3:
+        st.metric("Child Population (under 15)", "36.6 %")
+        st.caption("Source: World Bank (2023)")
+
+    with col4:
+        st.metric("Children Stunting Rate", "22.3 %")
+        st.caption("Source: UNICEF Ghana (2022)")
+
+    # Key Takeaways
+    st.markdown("""
+    ### Key Takeaways
+    - Mercury levels in predatory fish can reach **2.5–4.0 ppm**, over **25×** the safe limit
+    - Freshwater vertebrate populations have declined by **85 %** since 1970 (WWF)
+    - Ghana has lost **9.3 %** of its primary forest cover between 2002–2020
+    - Pollutants like **Lead** and **Cadmium** persist in sediment and soil for **20–25 years**
+    """)
+
+
+# Economic Consequences figures, built once per process by figure_registry
+@figure_registry.register('slide_11/sector_losses')
+def build_sector_loss_bar():
+    # Sectoral losses in Ghana and region (USD million)
+    economic_data = {
+        "Sector": ["Agriculture", "Fisheries", "Healthcare", "Water Treatment", "Tourism"],
+        "Annual Loss": [120, 80, 200, 45.6, 30],
+        "Type": ["Direct", "Direct", "Indirect", "Indirect", "Indirect"]
+    }
+    econ_df = pd.DataFrame(economic_data)
+    fig = px.bar(
+        econ_df,
+        x="Annual Loss",
+        y="Sector",
+        color="Type",
+        orientation="h",
+        title="Annual Economic Impact by Sector in Ghana"
+    )
+    fig.update_layout(xaxis_title="Loss (USD million)")
+    return fig
+
+
+@figure_registry.register('slide_11/gdp_loss')
+def build_gdp_loss_bar():
+    # Regional GDP loss
+    impact_df = pd.DataFrame({
+        "Impact Area": ["Sub‑Saharan Africa"],
+        "GDP Loss (%)": [5]
+    })
+    fig = px.bar(
+        impact_df,
+        x="GDP Loss (%)",
+        y="Impact Area",
+        orientation="h",
+        title="Regional GDP Loss due to Water Issues"
+    )
+    return fig
+
+
+# Slide 11: Economic Consequences
+def slide_11():
+    st.markdown("## Economic Consequences")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.plotly_chart(figure_registry.get('slide_11/sector_losses'), use_container_width=True)
+        st.markdown("""
+        • Agriculture & Fisheries losses from yield decline :contentReference[oaicite:14]{index=14}  
+        • Healthcare costs from waterborne diseases :contentReference[oaicite:15]{index=15}  
+        • Water treatment spending and reduced tourism revenue  
+        """)
+
+    with col2:
+        st.plotly_chart(figure_registry.get('slide_11/gdp_loss'), use_container_width=True)
+        st.markdown("Sub‑Saharan Africa loses **5 %** of GDP (~US$170 billion/yr) to water issues :contentReference[oaicite:16]{index=16}")
+
+    st.markdown("""
+    > **Context:**  
+    > Ghana’s agriculture workforce (~44 %) relies on seasonal water; loss of water quality directly threatens **US$200 million** in annual revenue :contentReference[oaicite:17]{index=17}  
+    > Over **30 %** of inland fisheries yield lost to pollution :contentReference[oaicite:18]{index=18}  
+    """)
+    st.markdown("""
+    **International High‑Level Panel on Water Investments for Africa** (2023). Sub‑Saharan Africa loses **5 %** of GDP (~US$ 170 billion/yr) due to poor water infrastructure and contamination. :contentReference[oaicite:6]{index=6}  
+    **African Development Bank** (2025). *World Water Day 2025: Preserving Africa’s Water Resources* — confirms the **5 %** GDP loss estimate. :contentReference[oaicite:7]{index=7}  
+    **Infrastructure Consortium for Africa** (2022). “The Water Challenge”: Sub‑Saharan Africa loses **5 %** of GDP annually from water issues. :contentReference[oaicite:8]{index=8}  
+    **Muntaka, A.** (2020). *Fisheries and Mangroves in Ghana*: fish stocks down ~**30 %** in key river deltas due to pollution.   
+    **OECD** (2024). *Diversifying Sources of Finance for Water in Africa*: reiterates **5 %** GDP loss to water scarcity and pollution. :contentReference[oaicite:9]{index=9}  
+    """)
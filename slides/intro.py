@@ -0,0 +1,70 @@
+import streamlit as st
+
+
+# Title Slide
+def slide_1():
+    st.markdown("# 💧 Silent Streams, Loud Consequences")
+    st.markdown("## The Impact of Water Pollution in Ghana")
+    st.markdown("---")
+    st.markdown("**Presented by:** Mawutor Afoh")
+    st.markdown(f"**Date:** April 21, 2025")
+
+# Why This Matters
+def slide_2():
+    st.markdown("## Why This Matters")
+
+    st.markdown("""
+    - **Illegal mining ("Galamsey")** has severely contaminated many of Ghana’s key rivers, including the Pra, Offin, and Ankobra.
+    - **Over 60 %** of tested river samples exceed WHO safety thresholds for pollutants like **mercury, arsenic, and lead**.
+    - Millions of Ghanaians rely on these water bodies for **drinking, irrigation, and fishing**—increasing exposure to toxic contaminants.
+    - **Communities face rising health risks**, food insecurity, and ecosystem collapse without urgent action.
+    - We must protect these water sources now to safeguard **public health, economic stability, and future generations**.
+    """)
+
+
+# Objectives
+def slide_3():
+    st.markdown("## Objectives of the Project")
+    st.markdown("""
+    - Identify rivers most affected by pollution
+    - Compare observed pollutant levels with WHO, US EPA, and Ghana standards
+    - Visualize pollutant exceedances and compute pollution risk scores
+    - Explore human and ecosystem health risks
+    - Inform policy recommendations and community actions
+    """)
+
+# Chemical Pollutants & Standards
+def slide_4():
+    st.markdown("## Chemical Pollutants & Standards")
+    
+    st.markdown("""
+    Water quality standards set by the **WHO**, **EPA**, and **Ghana Standards Authority** help protect public health and ecosystems.  
+    These limits define the **maximum safe concentration** of each pollutant in drinking water or natural water bodies.  
+    Even small exceedances over time can lead to **chronic health effects**, **bioaccumulation**, and **ecosystem damage**.
+
+    **Why These Standards Matter:**
+    - **Arsenic, Lead, Mercury, and Cadmium** are toxic heavy metals. Long-term exposure can cause **neurological damage, kidney failure**, and **cancer**.
+    - **pH** levels outside the 6.5–8.5 range can increase **metal solubility**, harming aquatic life and corroding infrastructure.
+    - **Total Dissolved Solids (TDS)** and **Conductivity** indicate general water quality. High levels affect **taste, crop yield**, and **irrigation systems**.
+    - **Hardness** impacts domestic and industrial water use, and excessive hardness can cause **scale buildup** and lower cleaning efficiency.
+
+    The table below compares limits from key regulatory bodies:
+    """)
+
+    standards_data = {
+        'Pollutant': ['Arsenic', 'Lead', 'Mercury', 'Cadmium', 'Chromium', 'pH', 'TDS', 'Conductivity', 'Hardness'],
+        'WHO Limit (mg/L)': ['0.01', '0.01', '0.001', '0.003', '0.05', '6.5–8.5', '1000', '1000', '500'],
+        'EPA Limit': ['0.01', '0.015', '0.002', '0.005', '0.1', '6.5–8.5', '500–1000', '500–1000', '500'],
+        'Ghana Standard': ['0.01', '0.01', '0.001', '0.003', '0.05', '6.5–8.5', '1000', '1000', '500']
+    }
+
+    # pandas is only needed here, so the title slide doesn't pay its import
+    import pandas as pd
+
+    standards_df = pd.DataFrame(standards_data)
+    st.table(standards_df)
+
+    st.markdown("""
+    > **Note:** Ghana’s standards largely align with WHO guidelines, emphasizing the **global consensus** on what constitutes safe water.  
+    > Monitoring and enforcing these standards is critical for safeguarding communities near **illegal mining hotspots**.
+    """)
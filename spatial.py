@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+
+from aggregates import RiverAggregates
+from pipeline import station_col, lat_col, lon_col
+
+earth_radius_km = 6371.0
+km_per_degree = np.pi * earth_radius_km / 180
+
+
+# Empty running sums of exceedances and risk score per sampling station for
+# samples with the given columns. Stations are keyed by Station and river,
+# with their coordinates summed when present, or without a Station column by
+# coordinates and river; None when the samples have neither
+def station_aggregates(columns):
+    coords = [lat_col, lon_col] if lat_col in columns and lon_col in columns else []
+    if station_col in columns:
+        return RiverAggregates(['exceedances_count', 'pollution_risk_score'] + coords, [station_col, 'Sample'])
+    if coords:
+        return RiverAggregates(['exceedances_count', 'pollution_risk_score'], coords + ['Sample'])
+    return None
+
+
+# One row per sampling station from its running sums: its coordinates (when
+# summed), river, sample count and mean exceedances and risk score. A
+# station sampled in several rivers is listed under the first of them; one
+# without a Station column is named after its coordinates
+def station_summary(stations):
+    groups = [key for key in stations.keys if key != 'Sample']
+    count = stations.count.groupby(level=groups, sort=True).sum()
+    means = stations.total.groupby(level=groups, sort=True).sum() / count
+    rivers = stations.count.index.to_frame(index=False).astype({'Sample': str})
+
+    table = pd.DataFrame({
+        'Sample': rivers.groupby(groups, sort=True)['Sample'].min(),
+        'samples': count['pollution_risk_score'].astype(int),
+        'exceedances_count': means['exceedances_count'],
+        'pollution_risk_score': means['pollution_risk_score'],
+    })
+    if lat_col in stations.columns:
+        table.insert(0, lat_col, means[lat_col])
+        table.insert(1, lon_col, means[lon_col])
+    table = table.reset_index()
+    if station_col not in groups:
+        table.insert(0, station_col, [f"{lat:.5f}, {lon:.5f}" for lat, lon in
+                                      zip(table[lat_col], table[lon_col])])
+    return table
+
+
+# Great-circle distance in km from one point to arrays of points
+def haversine_km(lat, lon, lats, lons):
+    lat, lon, lats, lons = map(np.radians, (lat, lon, lats, lons))
+    a = (np.sin((lats - lat) / 2) ** 2
+         + np.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2)
+    return 2 * earth_radius_km * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+# Uniform grid over station coordinates. Points are sorted by cell key, so
+# every row of cells in a query box is one contiguous slice found by binary
+# search; only points in those cells are tested exactly. Queries do not wrap
+# around the antimeridian
+class GridIndex:
+    def __init__(self, lat, lon, cell_deg=0.05):
+        self.lat = np.asarray(lat, dtype=float)
+        self.lon = np.asarray(lon, dtype=float)
+        self.cell_deg = cell_deg
+        self._columns = int(np.ceil(360 / cell_deg)) + 1
+
+        keys = self._key(self._row(self.lat), self._column(self.lon))
+        self._order = np.argsort(keys, kind='stable')
+        self._keys = keys[self._order]
+
+    def _row(self, lat):
+        return np.floor((np.asarray(lat) + 90) / self.cell_deg).astype(np.int64)
+
+    def _column(self, lon):
+        return np.floor((np.asarray(lon) + 180) / self.cell_deg).astype(np.int64)
+
+    def _key(self, row, column):
+        return row * self._columns + column
+
+    # Positions of the points inside [min_lat, max_lat] x [min_lon, max_lon]
+    def bbox(self, min_lat, max_lat, min_lon, max_lon):
+        rows = np.arange(self._row(min_lat), self._row(max_lat) + 1)
+        starts = np.searchsorted(self._keys, self._key(rows, self._column(min_lon)), side='left')
+        stops = np.searchsorted(self._keys, self._key(rows, self._column(max_lon)), side='right')
+        if not len(rows) or not (stops > starts).any():
+            return np.empty(0, dtype=np.int64)
+
+        candidates = self._order[np.concatenate([np.arange(a, b) for a, b in zip(starts, stops)])]
+        lat = self.lat[candidates]
+        lon = self.lon[candidates]
+        inside = (lat >= min_lat) & (lat <= max_lat) & (lon >= min_lon) & (lon <= max_lon)
+        return np.sort(candidates[inside])
+
+    # Positions and distances (km) of the points within radius_km of
+    # (lat, lon), nearest first
+    def radius(self, lat, lon, radius_km):
+        dlat = radius_km / km_per_degree
+        dlon = dlat / max(np.cos(np.radians(min(abs(lat) + dlat, 89.9))), 1e-6)
+        candidates = self.bbox(lat - dlat, lat + dlat, lon - dlon, lon + dlon)
+
+        distance = haversine_km(lat, lon, self.lat[candidates], self.lon[candidates])
+        near = distance <= radius_km
+        order = np.argsort(distance[near], kind='stable')
+        return candidates[near][order], distance[near][order]
+
+
+# Cell size in degrees for a web-map zoom level: about 32 screen pixels
+def zoom_cell_deg(zoom):
+    return 360 / 2 ** zoom / 8
+
+
+# Visible area of a map of the given pixel size at a zoom level
+def viewport(lat, lon, zoom, width=800, height=500):
+    degrees_per_pixel = 360 / 256 / 2 ** zoom
+    dlon = width / 2 * degrees_per_pixel
+    dlat = height / 2 * degrees_per_pixel * np.cos(np.radians(lat))
+    return lat - dlat, lat + dlat, lon - dlon, lon + dlon
+
+
+# Bin the stations at the given positions into cells of cell_deg degrees.
+# Each bin is placed at its stations' mean position and carries the number
+# of stations and samples and the sample-weighted mean exceedances and risk
+def bin_stations(stations, positions, cell_deg):
+    lat = stations[lat_col].to_numpy(float)[positions]
+    lon = stations[lon_col].to_numpy(float)[positions]
+    samples = stations['samples'].to_numpy(float)[positions]
+    cells = np.stack([np.floor(lat / cell_deg), np.floor(lon / cell_deg)], axis=1)
+    _, bins = np.unique(cells, axis=0, return_inverse=True)
+    bins = bins.ravel()
+
+    def total(weights):
+        return np.bincount(bins, weights=weights)
+
+    count = total(None)
+    weight = total(samples)
+    return pd.DataFrame({
+        lat_col: total(lat) / count,
+        lon_col: total(lon) / count,
+        'stations': count.astype(int),
+        'samples': weight.astype(int),
+        'exceedances_count': total(samples * stations['exceedances_count'].to_numpy(float)[positions]) / weight,
+        'pollution_risk_score': total(samples * stations['pollution_risk_score'].to_numpy(float)[positions]) / weight,
+    })
@@ -0,0 +1,169 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+
+import config
+from ingest import iter_chunks
+from pipeline import build_rules, apply_rules, prepare_samples, time_col, thresholds, risk_weights
+
+# Partition columns, as hive directories: Sample=River Oda/month=2024-03/
+partition_cols = ['Sample', 'month']
+
+# Most partitions one batch may write to, and files the writer keeps open
+max_partitions = 1_000_000
+max_open_files = 512
+
+# Build record kept next to the partitions; files starting with '_' are
+# skipped by the dataset reader
+manifest_name = '_store.json'
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+    except ImportError:
+        raise ImportError("The sample store requires pyarrow (pip install pyarrow)")
+    return pyarrow
+
+
+# Convert a lab file (CSV or Parquet) into the sample store at root: every
+# sample with its exceedance flags and risk score, partitioned by river and
+# sampling month, written chunk by chunk so the file is never fully in memory
+def write_store(path, root, chunk_rows=100_000):
+    pa = _require_pyarrow()
+    import pyarrow.dataset as ds
+
+    if os.path.isdir(root) and os.listdir(root):
+        if not os.path.exists(os.path.join(root, manifest_name)):
+            raise ValueError(f"{root} exists and is not a sample store")
+        shutil.rmtree(root)
+
+    rules = build_rules(thresholds)
+    chunks = iter_chunks(path, chunk_rows)
+    first = next(chunks, None)
+    if first is None:
+        raise ValueError(f"{os.path.basename(path)} contains no samples")
+
+    stats = {'rows': 0}
+
+    def prepare(chunk):
+        prepare_samples(chunk)
+        apply_rules(chunk, rules)
+        if time_col in chunk:
+            chunk['month'] = chunk[time_col].dt.strftime('%Y-%m').fillna('undated')
+        else:
+            chunk['month'] = 'undated'
+        stats['rows'] += len(chunk)
+        return chunk
+
+    first = pa.RecordBatch.from_pandas(prepare(first), preserve_index=False)
+    schema = first.schema.remove_metadata()
+
+    def batches():
+        yield first
+        for chunk in chunks:
+            yield pa.RecordBatch.from_pandas(prepare(chunk), schema=schema, preserve_index=False)
+
+    # Multi-year archives of hundreds of rivers have far more river x month
+    # partitions than pyarrow's default limit of 1024 per batch; open files
+    # stay bounded, as the writer closes the least recently used file
+    ds.write_dataset(
+        batches(), root, schema=schema, format='parquet',
+        partitioning=ds.partitioning(schema.empty_table().select(partition_cols).schema, flavor='hive'),
+        basename_template='part-{i}.parquet',
+        max_partitions=max_partitions, max_open_files=max_open_files
+    )
+
+    manifest = {
+        'source': os.path.abspath(path),
+        'rows': stats['rows'],
+        'columns': schema.names,
+        'thresholds': thresholds,
+        'weights': risk_weights,
+    }
+    with open(os.path.join(root, manifest_name), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, default=str)
+    return manifest
+
+
+def read_manifest(root):
+    with open(os.path.join(root, manifest_name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Identifies one build of the store; changes whenever it is rewritten
+def store_key(root):
+    stat = os.stat(os.path.join(root, manifest_name))
+    return hashlib.sha256(f"{os.path.abspath(root)}:{stat.st_mtime_ns}".encode()).hexdigest()
+
+
+# Read only the given columns, and only the partitions of the given rivers.
+# The river filter prunes whole directories; limit stops the scan after that
+# many rows
+def read_store(root, columns, rivers=None, limit=None):
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(root, format='parquet', partitioning='hive')
+    filter = ds.field('Sample').isin(list(rivers)) if rivers is not None else None
+    if limit is not None:
+        table = dataset.scanner(columns=list(columns), filter=filter).head(limit)
+    else:
+        table = dataset.to_table(columns=list(columns), filter=filter)
+    return table.to_pandas()
+
+
+# At most per_river uniformly sampled rows of every river with the given
+# columns. The store is scanned in chunks of about chunk_rows rows, keeping
+# the rows with the smallest random keys per river, so only the kept rows
+# and one chunk are ever in memory
+def sample_store(root, columns, per_river, chunk_rows=100_000, seed=0):
+    pa = _require_pyarrow()
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(root, format='parquet', partitioning='hive')
+    rng = np.random.default_rng(seed)
+    kept = read_store(root, columns, limit=0).assign(_key=0.0).astype({'Sample': str})
+
+    def keep(kept, batches):
+        chunk = pa.Table.from_batches(batches).to_pandas()
+        chunk = chunk.assign(_key=rng.random(len(chunk))).astype({'Sample': str})
+        kept = pd.concat([kept, chunk], ignore_index=True)
+        return kept.sort_values('_key').groupby('Sample', sort=False).head(per_river)
+
+    pending, rows = [], 0
+    for batch in dataset.to_batches(columns=list(columns), use_threads=False):
+        pending.append(batch)
+        rows += batch.num_rows
+        if rows >= chunk_rows:
+            kept, pending, rows = keep(kept, pending), [], 0
+    if pending:
+        kept = keep(kept, pending)
+    return kept.sort_values(['Sample', '_key']).drop(columns='_key').reset_index(drop=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a lab results file into the partitioned sample store.")
+    parser.add_argument('data', help="lab results file (CSV or Parquet)")
+    parser.add_argument('store', nargs='?', default=config.STORE_PATH,
+                        help="store directory (default: BLUEMETRIC_STORE)")
+    parser.add_argument('--chunk-rows', type=int, default=config.CHUNK_ROWS,
+                        help="rows read per chunk (default: BLUEMETRIC_CHUNK_ROWS)")
+    args = parser.parse_args(argv)
+
+    if not args.store:
+        parser.error("no store directory given and BLUEMETRIC_STORE is not set")
+    manifest = write_store(args.data, args.store, args.chunk_rows)
+    print(f"Wrote {manifest['rows']} samples to {args.store}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
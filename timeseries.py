@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from pipeline import time_col, station_col
+
+
+# Largest-Triangle-Three-Buckets downsampling: indices of n_out points of the
+# series (x, y) that keep its visual shape. The first and last points are
+# always kept; every bucket in between contributes the point forming the
+# largest triangle with the previous pick and the mean of the next bucket.
+# x must be sorted and numeric
+def lttb(x, y, n_out):
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1][:max(n_out, 0)], dtype=int)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+
+    picked = np.empty(n_out, dtype=int)
+    picked[0] = 0
+    picked[-1] = n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[stop:next_stop].mean()
+        next_y = y[stop:next_stop].mean()
+
+        area = np.abs((x[previous] - next_x) * (y[start:stop] - y[previous])
+                      - (x[previous] - x[start:stop]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        picked[i + 1] = previous
+    return picked
+
+
+# Time series of one parameter for one river, one line per station, together
+# downsampled to about budget points before they reach the browser: each
+# station gets an equal share, but at least 3 points to keep its endpoints
+# and shape
+def river_series(df, river, column, budget):
+    rows = df.loc[df['Sample'] == river, [time_col, column]
+                  + ([station_col] if station_col in df else [])]
+    rows = rows.dropna(subset=[time_col, column])
+    if station_col not in rows:
+        rows[station_col] = river
+
+    stations = rows.groupby(station_col, sort=True)
+    share = max(3, budget // max(stations.ngroups, 1))
+    parts = []
+    for station, group in stations:
+        group = group.sort_values(time_col)
+        x = group[time_col].to_numpy('datetime64[ns]').astype('int64')
+        parts.append(group.iloc[lttb(x, group[column].to_numpy(), share)])
+
+    if not parts:
+        return rows.iloc[:0]
+    return pd.concat(parts, ignore_index=True)
@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import config
+from compact import compact_frame, concat, is_compact
+from ingest import iter_chunks, parquet_suffixes
+from pipeline import build_rules, apply_rules, prepare_samples, source_dataset, thresholds
+
+logger = logging.getLogger(__name__)
+
+lab_file_suffixes = ('.csv',) + parquet_suffixes
+
+
+# The loaded dataset plus every batch appended since. Each append folds
+# only the new samples into a copy of the per-river sums and the bounded
+# row sample, then swaps in a new (df, aggregates, fingerprint) snapshot, so
+# readers never see a half-applied batch and the shared frames are never
+# modified. generation counts appends; the fingerprint changes with it,
+# which keys every figure and table cache to the current data
+class LiveDataset:
+    def __init__(self, df, aggregates, fingerprint, sample_rows, seed=0):
+        self.sample_rows = sample_rows
+        self.generation = 0
+        self.files = 0
+        self.rows = int(aggregates.count['pollution_risk_score'].sum())
+        self._base = fingerprint
+        self._snapshot = (df, aggregates, fingerprint)
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        return self._snapshot
+
+    # Append samples that already carry their flags and risk score
+    def append(self, batch):
+        with self._lock:
+            df, aggregates, _ = self._snapshot
+            aggregates = aggregates.copy().update(batch)
+            aggregates.frame()
+            if is_compact(df):
+                batch = compact_frame(batch)
+            df = self._sample(df, batch)
+
+            self.rows += len(batch)
+            self.generation += 1
+            fingerprint = hashlib.sha256(f"{self._base}:{self.generation}".encode()).hexdigest()
+            self._snapshot = (df, aggregates, fingerprint)
+
+    # Keep df a uniform sample of at most sample_rows of all rows seen: the
+    # number of new rows in it follows the hypergeometric distribution of
+    # drawing sample_rows from the old and new rows together
+    def _sample(self, df, batch):
+        batch = batch[df.columns.intersection(batch.columns)]
+        if len(df) + len(batch) > self.sample_rows:
+            new = self._rng.hypergeometric(len(batch), self.rows, self.sample_rows)
+            keep = np.sort(self._rng.choice(len(df), min(len(df), self.sample_rows - new), replace=False))
+            df = df.iloc[keep]
+            batch = batch.iloc[np.sort(self._rng.choice(len(batch), new, replace=False))]
+        frames = [df, batch]
+        return concat(frames) if is_compact(df) else pd.concat(frames, ignore_index=True)
+
+
+# Flag a lab file chunk by chunk and append the rows past the ones already
+# ingested from it. ingested maps each file to that row count and is updated
+# after every chunk, so a file that grows is only read for its new rows and
+# one that fails part way resumes where it stopped. Rows of a file that is
+# rewritten shorter cannot be taken back; they are kept and logged
+def ingest_file(live, path, chunk_rows, ingested):
+    rules = build_rules(thresholds)
+    done = ingested.get(path, 0)
+    position = 0
+    for chunk in iter_chunks(path, chunk_rows):
+        end = position + len(chunk)
+        if end > done:
+            chunk = chunk.iloc[max(done - position, 0):]
+            prepare_samples(chunk)
+            apply_rules(chunk, rules)
+            live.append(chunk)
+            if not done:
+                live.files += 1
+            ingested[path] = done = end
+        position = end
+    if position < done:
+        logger.warning("%s now has %d rows, fewer than the %d already ingested", path, position, done)
+
+
+# Lab files in folder that are new or changed since they were last seen and
+# unchanged for at least settle seconds, so files still being copied in are
+# picked up on a later pass. seen maps each file to its size and
+# modification time
+def pending_files(folder, seen, settle):
+    ready = []
+    now = time.time()
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if not entry.is_file() or entry.name.startswith(('.', '_')):
+                continue
+            if not entry.name.lower().endswith(lab_file_suffixes):
+                continue
+            stat = entry.stat()
+            version = (stat.st_size, stat.st_mtime_ns)
+            if seen.get(entry.path) != version and now - stat.st_mtime >= settle:
+                seen[entry.path] = version
+                ready.append(entry.path)
+    return sorted(ready)
+
+
+# Poll folder every interval seconds and ingest new lab files, and new rows
+# of changed ones, off the event loop. A file that cannot be read is logged
+# and retried from its last ingested row once it changes
+async def watch(live, folder, interval, chunk_rows):
+    seen = {}
+    ingested = {}
+    while True:
+        try:
+            paths = await asyncio.to_thread(pending_files, folder, seen, interval)
+        except OSError as exc:
+            logger.warning("Cannot read drop folder %s: %s", folder, exc)
+            paths = []
+        for path in paths:
+            before = ingested.get(path, 0)
+            try:
+                await asyncio.to_thread(ingest_file, live, path, chunk_rows, ingested)
+                logger.info("Ingested %d new rows of %s", ingested.get(path, 0) - before, path)
+            except (OSError, ValueError) as exc:
+                logger.warning("Skipped %s after %d new rows: %s", path, ingested.get(path, 0) - before, exc)
+        await asyncio.sleep(interval)
+
+
+# One live dataset per process, fed by a watcher task running on its own
+# event loop in a daemon thread
+@st.cache_resource(show_spinner=False)
+def live_dataset(folder):
+    df, aggregates, fingerprint = source_dataset()
+    live = LiveDataset(df, aggregates, fingerprint, config.SAMPLE_ROWS)
+    thread = threading.Thread(
+        target=asyncio.run, args=(watch(live, folder, config.WATCH_INTERVAL, config.CHUNK_ROWS),),
+        name='bluemetric-watcher', daemon=True
+    )
+    thread.start()
+    return live